@@ -5,6 +5,7 @@ Profile customization script for ApplicationAgent
 
 import asyncio
 import json
+import logging
 from pathlib import Path
 import sys
 
@@ -15,6 +16,16 @@ from src.models.profile import UserProfile, PersonalInfo, ContactInfo, Experienc
 from src.utils.storage import StorageManager
 from src.utils.paths import PathManager
 
+logger = logging.getLogger(__name__)
+
+
+def _coerce_int(value, fallback):
+    """Return value as an int, or fallback if it is empty or not a plain number"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return fallback
+
 
 async def customize_profile():
     """Customize the existing profile with real user data"""
@@ -92,31 +103,13 @@ async def customize_profile():
     # Get salary info
     print("\n💰 Salary Information:")
     current_salary = input(f"Current Salary [{existing_data.get('compensation', {}).get('current_salary', '')}]: ").strip()
-    if not current_salary:
-        current_salary = existing_data.get('compensation', {}).get('current_salary', '')
-    else:
-        try:
-            current_salary = int(current_salary)
-        except ValueError:
-            current_salary = existing_data.get('compensation', {}).get('current_salary', '')
+    current_salary = _coerce_int(current_salary, existing_data.get('compensation', {}).get('current_salary', ''))
     
     desired_min = input(f"Desired Salary Min [{existing_data.get('compensation', {}).get('desired_salary_min', '')}]: ").strip()
-    if not desired_min:
-        desired_min = existing_data.get('compensation', {}).get('desired_salary_min', '')
-    else:
-        try:
-            desired_min = int(desired_min)
-        except ValueError:
-            desired_min = existing_data.get('compensation', {}).get('desired_salary_min', '')
+    desired_min = _coerce_int(desired_min, existing_data.get('compensation', {}).get('desired_salary_min', ''))
     
     desired_max = input(f"Desired Salary Max [{existing_data.get('compensation', {}).get('desired_salary_max', '')}]: ").strip()
-    if not desired_max:
-        desired_max = existing_data.get('compensation', {}).get('desired_salary_max', '')
-    else:
-        try:
-            desired_max = int(desired_max)
-        except ValueError:
-            desired_max = existing_data.get('compensation', {}).get('desired_salary_max', '')
+    desired_max = _coerce_int(desired_max, existing_data.get('compensation', {}).get('desired_salary_max', ''))
     
     # Update the profile
     updated_data = existing_data.copy()
@@ -141,7 +134,7 @@ async def customize_profile():
         })
     
     if new_skills:
-        new_skills_list = [skill.strip() for skill in new_skills.split(',')]
+        new_skills_list = list(filter(None, (skill.strip() for skill in new_skills.split(','))))
         updated_data['technical_skills'].extend(new_skills_list)
     
     updated_data['compensation'].update({
@@ -181,8 +174,7 @@ async def main():
         
     except Exception as e:
         print(f"❌ Customization failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Customization failed")
 
 
 if __name__ == "__main__":
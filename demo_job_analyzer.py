@@ -7,6 +7,7 @@ Demonstrates the JobApplicationAgent's capabilities with sample job forms
 import asyncio
 import json
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
 # Add src to path
@@ -20,6 +21,22 @@ from src.utils.storage import StorageManager
 from src.utils.paths import PathManager
 
 
+@dataclass(frozen=True)
+class SampleForm:
+    """A bundled demo job form and the role it advertises"""
+    name: str
+    file: str
+    company: str
+    role: str
+
+
+# Sample forms to analyze
+SAMPLE_FORMS = (
+    SampleForm('Tech Company Form', 'demo_samples/sample_job_form_tech.html', 'TechCorp', 'Senior AI/ML Engineer'),
+    SampleForm('Startup Form', 'demo_samples/sample_job_form_startup.html', 'InnovateLabs', 'AI Engineer'),
+)
+
+
 async def load_sample_form(form_path: str) -> str:
     """Load a sample HTML form"""
     try:
@@ -95,36 +112,20 @@ async def demo_form_analysis():
     
     print(f"✅ Loaded profile for: {profile.get('personal', {}).get('first_name', 'Unknown')} {profile.get('personal', {}).get('last_name', 'User')}")
     
-    # Sample forms to analyze
-    sample_forms = [
-        {
-            'name': 'Tech Company Form',
-            'file': 'demo_samples/sample_job_form_tech.html',
-            'company': 'TechCorp',
-            'role': 'Senior AI/ML Engineer'
-        },
-        {
-            'name': 'Startup Form',
-            'file': 'demo_samples/sample_job_form_startup.html',
-            'company': 'InnovateLabs',
-            'role': 'AI Engineer'
-        }
-    ]
-    
     # Analyze each form
-    for i, form_info in enumerate(sample_forms, 1):
-        print(f"\n{i + 2}. Analyzing {form_info['name']}...")
+    for i, form_info in enumerate(SAMPLE_FORMS, 1):
+        print(f"\n{i + 2}. Analyzing {form_info.name}...")
         
         # Load form HTML
-        html_content = await load_sample_form(form_info['file'])
+        html_content = await load_sample_form(form_info.file)
         if not html_content:
             continue
         
         # Job context
         job_context = {
-            'company': form_info['company'],
-            'role': form_info['role'],
-            'description': f"AI/ML engineering position at {form_info['company']}"
+            'company': form_info.company,
+            'role': form_info.role,
+            'description': f"AI/ML engineering position at {form_info.company}"
         }
         
         try:
@@ -195,13 +196,13 @@ async def demo_form_analysis():
             print(f"   💰 Tokens used: {total_tokens}, Estimated cost: ${total_cost:.4f}")
             
         except Exception as e:
-            print(f"   ❌ Error processing {form_info['name']}: {str(e)}")
+            print(f"   ❌ Error processing {form_info.name}: {str(e)}")
             continue
     
     # Summary
     print(f"\n🎉 Demo Complete!")
     print(f"📊 Summary:")
-    print(f"   • Analyzed {len(sample_forms)} sample job forms")
+    print(f"   • Analyzed {len(SAMPLE_FORMS)} sample job forms")
     print(f"   • Demonstrated AI-powered field analysis and matching")
     print(f"   • Generated contextual responses for form fields")
     print(f"   • Showed cost tracking and token usage")
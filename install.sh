@@ -84,13 +84,13 @@ echo "      nano .env"
 echo ""
 echo "   2. Test the CLI:"
 echo "      source venv/bin/activate"
-echo "      python src/cli.py setup"
+echo "      python -m src.cli setup"
 echo ""
 echo "   3. Create a profile:"
-echo "      python src/cli.py create-profile"
+echo "      python -m src.cli create-profile"
 echo ""
 echo "   4. Test AI features:"
-echo "      python src/cli.py test-ai"
+echo "      python -m src.cli test-ai"
 echo ""
 echo "   5. For Claude Desktop integration:"
 echo "      - Copy claude_desktop_config.json to your Claude config"
@@ -107,7 +107,7 @@ echo "   - Typical usage: $0.50-$5.00 per month"
 echo "   - Built-in cost tracking and budget alerts"
 echo ""
 echo "❓ Need help?"
-echo "   - Run: python src/cli.py --help"
+echo "   - Run: python -m src.cli --help"
 echo "   - Check the README.md for detailed documentation"
 echo "   - Report issues on GitHub"
 echo ""
@@ -13,5 +13,5 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from src.server import main
 
 if __name__ == "__main__":
-    print("🚀 Starting Job Application Agent MCP Server...")
+    print("🚀 Starting Job Application Agent MCP Server...", file=sys.stderr)
     asyncio.run(main())
\ No newline at end of file
@@ -71,11 +71,18 @@ setup(
             "mypy>=1.5.0",
             "pre-commit>=3.4.0",
         ],
+        "perf": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+            "orjson>=3.9.0",
+            "rapidfuzz>=3.0.0",
+            "h2>=4.1.0",
+        ],
     },
     entry_points={
         "console_scripts": [
             "job-agent=job_application_agent.cli:main",
             "job-agent-server=job_application_agent.server:main",
+            "job-agentc=job_application_agent.cli_client:main",
         ],
     },
     include_package_data=True,
@@ -5,6 +5,7 @@ Simple profile setup script for ApplicationAgent
 
 import asyncio
 import json
+import logging
 from pathlib import Path
 import sys
 
@@ -15,6 +16,8 @@ from src.models.profile import UserProfile, PersonalInfo, ContactInfo, Experienc
 from src.utils.storage import StorageManager
 from src.utils.paths import PathManager
 
+logger = logging.getLogger(__name__)
+
 
 async def create_sample_profile():
     """Create a sample user profile"""
@@ -215,8 +218,7 @@ async def main():
         
     except Exception as e:
         print(f"❌ Setup failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Setup failed")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,8 @@
+"""
+Entry point for `python -m src`
+"""
+
+from .cli import main
+
+if __name__ == '__main__':
+    main()
@@ -1,45 +1,181 @@
 #!/usr/bin/env python3
 """
 Command Line Interface for Job Application Agent
+
+Run as a package module from the repository root: python -m src.cli
 """
 
 import asyncio
+import contextlib
+import functools
+import hashlib
+import heapq
+import io
 import json
 import os
+import secrets
 import sys
+import tempfile
+import time
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
 import click
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt, Confirm
 from rich import print as rprint
 from dotenv import load_dotenv
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
-
 # Load environment variables from .env file
 load_dotenv(Path(__file__).parent.parent / '.env')
 
-from services.deepseek_service import DeepSeekService
-from services.form_analyzer import FormAnalyzer
-from services.semantic_matcher import SemanticMatcher
-from services.response_generator import ResponseGenerator
-from models.profile import UserProfile, PersonalInfo, ContactInfo
-from models.ai_config import AIProviderConfig, AIProviderType
-from utils.storage import StorageManager
-from utils.paths import PathManager
+# Service and model modules are imported inside the commands that need them,
+# so commands without AI work don't pay for loading the AI stack
+from .utils.storage import StorageManager
+from .utils.paths import PathManager
+from .cli_client import default_socket_path
 
 console = Console()
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Single event loop shared by every command in the process (see run_async)
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the CLI's event loop, creating it (with uvloop when installed) on first use"""
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        if uvloop is not None and sys.platform != 'win32':
+            _event_loop = uvloop.new_event_loop()
+        else:
+            _event_loop = asyncio.new_event_loop()
+    return _event_loop
+
+
+def run_async(coro):
+    """Run a coroutine to completion on the CLI's shared event loop
+    
+    Using one loop avoids building a loop per command and keeps the AI
+    client's pooled connections usable between commands. When the loop is
+    already running (commands invoked from a 'serve' worker thread), the
+    coroutine is submitted to it instead.
+    """
+    loop = _get_event_loop()
+    if loop.is_running():
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+    
+    task = loop.create_task(coro)
+    try:
+        return loop.run_until_complete(task)
+    except KeyboardInterrupt:
+        # Cancel and finish the task so its cleanup runs, as asyncio.run does on Ctrl+C
+        task.cancel()
+        try:
+            loop.run_until_complete(task)
+        except (asyncio.CancelledError, KeyboardInterrupt):
+            pass
+        raise
+
+# Commands that prompt on stdin cannot be served over the socket
+_INTERACTIVE_COMMANDS = frozenset({"setup", "create-profile", "serve"})
+
+# Row caps for listing tables; rich measures every cell, so huge tables render slowly
+MAX_PROFILE_ROWS = 50
+MAX_OPERATION_ROWS = 20
+
+# Column (header, style) specs for the CLI's tables
+_SETUP_COLUMNS = (("Component", "cyan"), ("Status", "magenta"))
+_FORM_FIELDS_COLUMNS = (("Field ID", "cyan"), ("Label", "white"), ("Type", "yellow"), ("Required", "red"))
+_PROFILE_SUMMARY_COLUMNS = (("Field", "cyan"), ("Value", "white"))
+_PROFILES_COLUMNS = (("Profile ID", "cyan"), ("Name", "white"), ("Email", "blue"), ("Created", "green"))
+_AI_INFO_COLUMNS = (("Property", "cyan"), ("Value", "white"))
+_USAGE_COLUMNS = (("Metric", "cyan"), ("Value", "white"))
+_OPERATIONS_COLUMNS = (("Operation", "cyan"), ("Count", "white"), ("Cost", "yellow"))
+
+
+# Status cell text indexed by a bool
+_REQ_GLYPH = {True: "✅", False: "❌"}
+_CONN_GLYPH = {True: "✅ Configured", False: "❌ Not configured"}
+
+
+@functools.lru_cache(maxsize=None)
+def _progress_columns() -> tuple:
+    """Spinner progress columns, built once on first use (rich.progress is imported lazily)"""
+    from rich.progress import SpinnerColumn, TextColumn
+    
+    return (SpinnerColumn(), TextColumn("[progress.description]{task.description}"))
+
+
+def _spinner():
+    """Transient spinner display that is cleared from the terminal when it finishes"""
+    from rich.progress import Progress
+    
+    return Progress(*_progress_columns(), console=console, transient=True)
+
+
+def _make_table(title: str, columns: tuple) -> Table:
+    """Build a rich Table with the given (header, style) columns"""
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
+
+# Forms larger than this are refused rather than sent to the AI service
+MAX_HTML_FILE_BYTES = 2 * 1024 * 1024
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _deepseek_config() -> Optional[MappingProxyType]:
+    """DeepSeek service config read from the environment once per process (None without an API key)"""
+    api_key = os.getenv('DEEPSEEK_API_KEY')
+    if not api_key:
+        return None
+    
+    return MappingProxyType({
+        'api_key': api_key,
+        'api_base': os.getenv('DEEPSEEK_API_BASE', 'https://api.deepseek.com/v1'),
+        'model': os.getenv('DEEPSEEK_MODEL', 'deepseek-chat'),
+        'max_tokens': 4000,
+        'temperature': 0.1,
+        'cost_per_1k_input': 0.00014,
+        'cost_per_1k_output': 0.00028
+    })
+
+
+def _new_sortable_id() -> str:
+    """ULID-style ID: 48-bit millisecond timestamp then 80 random bits, sortable by creation time"""
+    return f"{time.time_ns() // 1_000_000:012x}{secrets.token_hex(10)}"
+
+
+def _read_html_file(html_file: str) -> tuple:
+    """Read an HTML file, hashing it during the read; returns (html_content, digest)"""
+    hasher = hashlib.blake2b(digest_size=8)
+    chunks = []
+    
+    with open(html_file, 'rb') as f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK_BYTES), b''):
+            hasher.update(chunk)
+            chunks.append(chunk)
+    
+    return b''.join(chunks).decode('utf-8'), hasher.hexdigest()
+
 
 class JobApplicationCLI:
     """Command Line Interface for Job Application Agent"""
     
+    # Reused across initialize() calls so a resident CLI keeps its warm AI client
+    _shared_ai_service = None
+    
     def __init__(self):
         self.path_manager = PathManager()
         self.storage_manager = None
@@ -47,61 +183,133 @@ class JobApplicationCLI:
         self.form_analyzer = None
         self.semantic_matcher = None
         self.response_generator = None
+        self._ai_probe_task: Optional[asyncio.Task] = None
     
-    async def initialize(self):
-        """Initialize CLI services"""
+    async def initialize(self, skip_ai: bool = False):
+        """Initialize CLI services
+        
+        With skip_ai=True only storage is set up; the AI service is neither
+        constructed nor connection-tested. Otherwise the connection test runs
+        in the background; commands that need a live connection await it via
+        wait_for_ai().
+        """
         # Initialize storage
         self.storage_manager = StorageManager(self.path_manager.get_data_dir())
         await self.storage_manager.initialize()
         
+        if skip_ai:
+            return
+        
         # Initialize AI service if API key is available
-        api_key = os.getenv('DEEPSEEK_API_KEY')
-        if api_key:
-            config = {
-                'api_key': api_key,
-                'api_base': os.getenv('DEEPSEEK_API_BASE', 'https://api.deepseek.com/v1'),
-                'model': os.getenv('DEEPSEEK_MODEL', 'deepseek-chat'),
-                'max_tokens': 4000,
-                'temperature': 0.1,
-                'cost_per_1k_input': 0.00014,
-                'cost_per_1k_output': 0.00028
-            }
+        config = _deepseek_config()
+        if config:
+            from .services.deepseek_service import DeepSeekService
+            from .services.form_analyzer import FormAnalyzer
+            from .services.semantic_matcher import SemanticMatcher
+            from .services.response_generator import ResponseGenerator
+            
+            if JobApplicationCLI._shared_ai_service is None:
+                JobApplicationCLI._shared_ai_service = DeepSeekService(config)
             
-            self.ai_service = DeepSeekService(config)
+            self.ai_service = JobApplicationCLI._shared_ai_service
             self.form_analyzer = FormAnalyzer(self.ai_service)
             self.semantic_matcher = SemanticMatcher(self.ai_service)
             self.response_generator = ResponseGenerator(self.ai_service)
             
-            # Test connection
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task("Testing AI connection...", total=None)
-                
-                try:
-                    connected = await self.ai_service.test_connection()
-                    if connected:
-                        console.print("✅ AI service connected successfully", style="green")
-                    else:
-                        console.print("❌ AI service connection failed", style="red")
-                        self.ai_service = None
-                except Exception as e:
-                    console.print(f"❌ AI service error: {str(e)}", style="red")
-                    self.ai_service = None
+            # Test connection off the startup path
+            self._ai_probe_task = asyncio.create_task(self._probe_ai_connection())
         
         else:
             console.print("⚠️ No DEEPSEEK_API_KEY found - AI features disabled", style="yellow")
+    
+    async def _probe_ai_connection(self) -> bool:
+        """Test the AI connection, dropping the AI service if it is unreachable"""
+        try:
+            connected = await self.ai_service.test_connection()
+            if connected:
+                console.print("✅ AI service connected successfully", style="green")
+            else:
+                console.print("❌ AI service connection failed", style="red")
+        except Exception as e:
+            console.print(f"❌ AI service error: {str(e)}", style="red")
+            connected = False
+        
+        if not connected:
+            self.ai_service = None
+        return connected
+    
+    async def wait_for_ai(self) -> bool:
+        """Wait for the background connection test; returns whether the AI service is usable"""
+        task = self._ai_probe_task
+        if task is not None and not task.done():
+            with _spinner() as progress:
+                progress.add_task("Testing AI connection...", total=None)
+                await task
+        
+        return self.ai_service is not None
+    
+    def cancel_ai_probe(self):
+        """Cancel a connection test that no command ended up waiting for"""
+        task = self._ai_probe_task
+        if task is not None and not task.done():
+            task.cancel()
+            run_async(asyncio.gather(task, return_exceptions=True))
+
+
+def _set_env_value(env_file: Path, key: str, value: str):
+    """Set key=value in a .env file, replacing an existing entry, with one atomic write"""
+    lines = env_file.read_text(encoding='utf-8').splitlines() if env_file.exists() else []
+    entry = f"{key}={value}"
+    
+    for i, line in enumerate(lines):
+        if line.split('=', 1)[0].strip() == key:
+            lines[i] = entry
+            break
+    else:
+        lines.append(entry)
+    
+    tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=env_file.parent, delete=False)
+    try:
+        with tmp:
+            tmp.write("\n".join(lines) + "\n")
+        os.replace(tmp.name, env_file)
+    except BaseException:
+        # Never leave a half-written temp file beside the .env file
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+
+
+def requires_ai(command):
+    """Mark a CLI command as needing the AI service initialized before it runs"""
+    command.needs_ai = True
+    return command
+
+
+class _CLIGroup(click.Group):
+    """Command group that notes whether --help was requested for a subcommand"""
+    
+    def parse_args(self, ctx, args):
+        help_options = self.get_help_option_names(ctx)
+        options = args[:args.index('--')] if '--' in args else args
+        ctx.meta['help_requested'] = any(arg in help_options for arg in options)
+        return super().parse_args(ctx, args)
 
 
-@click.group()
+@click.group(cls=_CLIGroup)
 @click.pass_context
 def cli(ctx):
     """Job Application Agent CLI - AI-powered job application automation"""
+    if ctx.meta.get('help_requested'):
+        # Click prints the subcommand's help and exits before it runs; nothing to initialize
+        return
+    
     if ctx.obj is None:
+        command = cli.get_command(ctx, ctx.invoked_subcommand) if ctx.invoked_subcommand else None
+        needs_ai = getattr(command, 'needs_ai', False)
+        
         ctx.obj = JobApplicationCLI()
-        asyncio.run(ctx.obj.initialize())
+        ctx.call_on_close(ctx.obj.cancel_ai_probe)
+        run_async(ctx.obj.initialize(skip_ai=not needs_ai))
 
 
 @cli.command()
@@ -123,13 +331,7 @@ def setup(ctx):
             env_file = cli_obj.path_manager.get_base_dir() / ".env"
             
             # Create or update .env file
-            env_content = f"DEEPSEEK_API_KEY={api_key}\n"
-            if env_file.exists():
-                with open(env_file, 'a') as f:
-                    f.write(env_content)
-            else:
-                with open(env_file, 'w') as f:
-                    f.write(env_content)
+            _set_env_value(env_file, "DEEPSEEK_API_KEY", api_key)
             
             console.print("✅ API key saved to .env file", style="green")
             console.print("Please restart the CLI to use AI features", style="blue")
@@ -139,17 +341,16 @@ def setup(ctx):
     console.print("✅ Created necessary directories", style="green")
     
     # Show setup summary
-    table = Table(title="Setup Summary")
-    table.add_column("Component", style="cyan")
-    table.add_column("Status", style="magenta")
+    table = _make_table("Setup Summary", _SETUP_COLUMNS)
     
     table.add_row("Data Directory", str(cli_obj.path_manager.get_data_dir()))
     table.add_row("Config Directory", str(cli_obj.path_manager.get_config_dir()))
-    table.add_row("AI Service", "✅ Connected" if cli_obj.ai_service else "❌ Not configured")
+    table.add_row("AI Service", _CONN_GLYPH[bool(api_key)])
     
     console.print(table)
 
 
+@requires_ai
 @cli.command()
 @click.option('--html-file', type=click.Path(exists=True), help='Path to HTML file to analyze')
 @click.option('--url', help='URL of job application form')
@@ -162,14 +363,22 @@ def analyze_form(ctx, html_file: Optional[str], url: Optional[str]):
         console.print("❌ Please provide either --html-file or --url", style="red")
         return
     
-    if not cli_obj.form_analyzer:
+    if not cli_obj.form_analyzer or not run_async(cli_obj.wait_for_ai()):
         console.print("❌ Form analyzer not available (AI service not configured)", style="red")
         return
     
     # Read HTML content
     if html_file:
-        with open(html_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        file_size = os.stat(html_file).st_size
+        if file_size > MAX_HTML_FILE_BYTES:
+            console.print(
+                f"⚠️ {html_file} is {file_size / (1024 * 1024):.1f} MB; "
+                f"forms over {MAX_HTML_FILE_BYTES // (1024 * 1024)} MB are not analyzed",
+                style="yellow"
+            )
+            return
+        
+        html_content, html_digest = _read_html_file(html_file)
         console.print(f"📄 Analyzing form from file: {html_file}")
     else:
         # TODO: Implement URL fetching
@@ -200,18 +409,14 @@ def analyze_form(ctx, html_file: Optional[str], url: Optional[str]):
                 # Fields table
                 fields = analysis_data.get('fields', [])
                 if fields:
-                    table = Table(title="Form Fields")
-                    table.add_column("Field ID", style="cyan")
-                    table.add_column("Label", style="white")
-                    table.add_column("Type", style="yellow")
-                    table.add_column("Required", style="red")
+                    table = _make_table("Form Fields", _FORM_FIELDS_COLUMNS)
                     
                     for field in fields[:10]:  # Show first 10 fields
                         table.add_row(
                             field.get('field_id', ''),
                             field.get('label', ''),
                             field.get('field_type', ''),
-                            "✅" if field.get('required') else "❌"
+                            _REQ_GLYPH[bool(field.get('required'))]
                         )
                     
                     console.print(table)
@@ -220,7 +425,8 @@ def analyze_form(ctx, html_file: Optional[str], url: Optional[str]):
                         console.print(f"... and {len(fields) - 10} more fields")
                 
                 # Save analysis results
-                form_id = f"form_{hash(html_content) % 10000}"
+                # Stable across runs (unlike hash()) so re-analysing a form overwrites its record
+                form_id = f"form_{html_digest}"
                 saved = await cli_obj.storage_manager.save_form(form_id, analysis_data)
                 if saved:
                     console.print(f"💾 Analysis saved with ID: {form_id}", style="green")
@@ -232,19 +438,17 @@ def analyze_form(ctx, html_file: Optional[str], url: Optional[str]):
             console.print(f"❌ Error during form analysis: {str(e)}", style="red")
 
     # Analyze the form
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    with _spinner() as progress:
         task = progress.add_task("Analyzing form with AI...", total=None)
-        asyncio.run(run_analysis())
+        run_async(run_analysis())
 
 
 @cli.command()
 @click.pass_context
 def create_profile(ctx):
     """Create a new user profile interactively"""
+    from .models.profile import UserProfile, PersonalInfo, ContactInfo
+    
     cli_obj = ctx.obj
     
     console.print(Panel.fit("👤 Create User Profile", style="bold green"))
@@ -271,12 +475,12 @@ def create_profile(ctx):
     # Skills
     console.print("\nTechnical Skills (comma-separated):", style="bold")
     skills_input = Prompt.ask("Enter your technical skills", default="")
-    technical_skills = [skill.strip() for skill in skills_input.split(',') if skill.strip()]
+    technical_skills = list(filter(None, (skill.strip() for skill in skills_input.split(','))))
     
     # Create profile object
     try:
         profile = UserProfile(
-            profile_id=f"profile_{hash(email) % 10000}",
+            profile_id=f"profile_{_new_sortable_id()}",
             personal=PersonalInfo(
                 first_name=first_name,
                 last_name=last_name,
@@ -295,15 +499,13 @@ def create_profile(ctx):
         async def save_profile():
             return await cli_obj.storage_manager.save_profile(profile.profile_id, profile.model_dump())
         
-        saved = asyncio.run(save_profile())
+        saved = run_async(save_profile())
         
         if saved:
             console.print(f"✅ Profile created with ID: {profile.profile_id}", style="green")
             
             # Display profile summary
-            table = Table(title="Profile Summary")
-            table.add_column("Field", style="cyan")
-            table.add_column("Value", style="white")
+            table = _make_table("Profile Summary", _PROFILE_SUMMARY_COLUMNS)
             
             table.add_row("Name", profile.personal.full_name)
             table.add_row("Email", str(profile.contact.email))
@@ -326,53 +528,53 @@ def list_profiles(ctx):
     cli_obj = ctx.obj
     
     try:
-        async def get_profiles():
-            return await cli_obj.storage_manager.list_profiles()
+        table = _make_table("User Profiles", _PROFILES_COLUMNS)
+        
+        async def fill_table():
+            """Stream index rows into the table; returns (shown, total) row counts"""
+            shown = total = 0
+            async for profile in cli_obj.storage_manager.iter_profiles_index():
+                total += 1
+                if shown < MAX_PROFILE_ROWS:
+                    table.add_row(
+                        profile.get('profile_id', ''),
+                        profile.get('name', ''),
+                        profile.get('email', ''),
+                        profile.get('created_at', '')[:10] if profile.get('created_at') else ''
+                    )
+                    shown += 1
+            return shown, total
         
-        profiles = asyncio.run(get_profiles())
+        shown, total = run_async(fill_table())
         
-        if not profiles:
+        if not shown:
             console.print("No profiles found. Use 'create-profile' to create one.", style="yellow")
             return
         
-        table = Table(title="User Profiles")
-        table.add_column("Profile ID", style="cyan")
-        table.add_column("Name", style="white")
-        table.add_column("Email", style="blue")
-        table.add_column("Created", style="green")
-        
-        for profile in profiles:
-            table.add_row(
-                profile.get('profile_id', ''),
-                profile.get('name', ''),
-                profile.get('email', ''),
-                profile.get('created_at', '')[:10] if profile.get('created_at') else ''
-            )
-        
         console.print(table)
         
+        if total > shown:
+            console.print(f"... and {total - shown} more profiles")
+        
     except Exception as e:
         console.print(f"❌ Error listing profiles: {str(e)}", style="red")
 
 
+@requires_ai
 @cli.command()
 @click.pass_context
 def test_ai(ctx):
     """Test AI service connection and capabilities"""
     cli_obj = ctx.obj
     
-    if not cli_obj.ai_service:
+    if not run_async(cli_obj.wait_for_ai()):
         console.print("❌ AI service not configured", style="red")
         return
     
     console.print(Panel.fit("🤖 Testing AI Service", style="bold blue"))
     
     # Test connection
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    with _spinner() as progress:
         task = progress.add_task("Testing connection...", total=None)
         
         async def run_test():
@@ -385,9 +587,7 @@ def test_ai(ctx):
                     # Get model info
                     model_info = await cli_obj.ai_service.get_model_info()
                     
-                    table = Table(title="AI Service Info")
-                    table.add_column("Property", style="cyan")
-                    table.add_column("Value", style="white")
+                    table = _make_table("AI Service Info", _AI_INFO_COLUMNS)
                     
                     for key, value in model_info.items():
                         table.add_row(str(key), str(value))
@@ -404,9 +604,10 @@ def test_ai(ctx):
             except Exception as e:
                 console.print(f"❌ Error testing AI service: {str(e)}", style="red")
         
-        asyncio.run(run_test())
+        run_async(run_test())
 
 
+@requires_ai
 @cli.command()
 @click.pass_context
 def usage_stats(ctx):
@@ -419,9 +620,7 @@ def usage_stats(ctx):
     
     stats = cli_obj.ai_service.get_usage_stats("month")
     
-    table = Table(title="AI Usage Statistics (This Month)")
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="white")
+    table = _make_table("AI Usage Statistics (This Month)", _USAGE_COLUMNS)
     
     table.add_row("Total Requests", str(stats['total_requests']))
     table.add_row("Success Rate", f"{stats['success_rate']:.1f}%")
@@ -434,12 +633,11 @@ def usage_stats(ctx):
     # Show operations breakdown
     operations = stats.get('operations', {})
     if operations:
-        op_table = Table(title="Operations Breakdown")
-        op_table.add_column("Operation", style="cyan")
-        op_table.add_column("Count", style="white")
-        op_table.add_column("Cost", style="yellow")
+        op_table = _make_table("Operations Breakdown", _OPERATIONS_COLUMNS)
         
-        for op_name, op_data in operations.items():
+        # Most expensive operations first
+        top_operations = heapq.nlargest(MAX_OPERATION_ROWS, operations.items(), key=lambda kv: kv[1]['cost'])
+        for op_name, op_data in top_operations:
             op_table.add_row(
                 op_name,
                 str(op_data['count']),
@@ -447,6 +645,110 @@ def usage_stats(ctx):
             )
         
         console.print(op_table)
+        
+        if len(operations) > MAX_OPERATION_ROWS:
+            console.print(f"... and {len(operations) - MAX_OPERATION_ROWS} more operations")
+
+
+def _run_served_command(cli_obj: JobApplicationCLI, argv: list, cwd: Optional[str] = None) -> bytes:
+    """Run one CLI invocation against the shared CLI object and capture its output
+    
+    Relative paths in argv are resolved against cwd, the client's working directory.
+    """
+    output = io.StringIO()
+    server_cwd = os.getcwd()
+    
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        if argv and argv[0] in _INTERACTIVE_COMMANDS:
+            print(f"❌ '{argv[0]}' is interactive; run it without the CLI server")
+        else:
+            try:
+                if cwd:
+                    os.chdir(cwd)
+                cli.main(args=argv, prog_name="job-agent", standalone_mode=False, obj=cli_obj)
+            except click.exceptions.Exit:
+                pass
+            except click.ClickException as e:
+                e.show()
+            except Exception as e:
+                print(f"❌ Error: {str(e)}")
+            finally:
+                os.chdir(server_cwd)
+    
+    return output.getvalue().encode('utf-8')
+
+
+async def _serve(cli_obj: JobApplicationCLI, socket_path: Path):
+    """Accept CLI requests on a Unix socket until cancelled"""
+    loop = asyncio.get_running_loop()
+    # Commands share one CLI object, redirect stdout and change directory, so run them one at a time
+    lock = asyncio.Lock()
+    
+    async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = json.loads(await reader.readline())
+            async with lock:
+                # Commands block on run_async(), which hands their coroutines back to this loop
+                output = await loop.run_in_executor(
+                    None, _run_served_command, cli_obj, request.get("argv", []), request.get("cwd")
+                )
+            writer.write(output)
+            await writer.drain()
+        except Exception as e:
+            writer.write(f"❌ Invalid request: {str(e)}\n".encode('utf-8'))
+        finally:
+            writer.close()
+    
+    if socket_path.exists():
+        # Only a stale socket may be replaced; a live one belongs to another server
+        try:
+            _, probe = await asyncio.open_unix_connection(str(socket_path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            pass
+        except PermissionError:
+            raise click.ClickException(f"{socket_path} belongs to another user; pass --socket to use another path")
+        else:
+            probe.close()
+            raise click.ClickException(f"A CLI server is already listening on {socket_path}")
+        
+        try:
+            socket_path.unlink(missing_ok=True)
+        except PermissionError:
+            raise click.ClickException(f"{socket_path} belongs to another user; pass --socket to use another path")
+    
+    server = await asyncio.start_unix_server(handle_client, path=str(socket_path))
+    # Only the owner may send commands
+    os.chmod(socket_path, 0o600)
+    console.print(f"🔌 Serving CLI commands on {socket_path} (Ctrl+C to stop)", style="green")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if socket_path.exists():
+            socket_path.unlink()
+        
+        from .services.deepseek_service import close_shared_http_client
+        await close_shared_http_client()
+
+
+@requires_ai
+@cli.command()
+@click.option('--socket', 'socket_path', type=click.Path(), default=None, help='Unix socket path to listen on')
+@click.pass_context
+def serve(ctx, socket_path: Optional[str]):
+    """Keep the CLI resident and serve commands from job-agentc over a Unix socket"""
+    cli_obj = ctx.obj
+    
+    if not hasattr(asyncio, 'start_unix_server'):
+        console.print("❌ CLI server requires Unix domain socket support", style="red")
+        return
+    
+    socket_path = Path(socket_path) if socket_path else default_socket_path()
+    
+    try:
+        run_async(_serve(cli_obj, socket_path))
+    except KeyboardInterrupt:
+        console.print("👋 CLI server stopped", style="blue")
 
 
 def main():
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Thin client for a resident Job Application Agent CLI (`cli serve`)
+
+Only the standard library is imported here so that each call skips the
+click/rich/AI-service import cost and reuses the server's warm state.
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+SOCKET_NAME = "job_agent.sock"
+
+
+def default_socket_path() -> Path:
+    """Get the Unix socket path shared by `cli serve` and this client"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / SOCKET_NAME
+    
+    # The shared temp directory needs a per-user name so users never collide
+    uid = os.getuid() if hasattr(os, "getuid") else os.getpid()
+    return Path(tempfile.gettempdir()) / f"job_agent-{uid}.sock"
+
+
+def send_command(argv: List[str], socket_path: Optional[Path] = None) -> int:
+    """Send CLI arguments to the resident server and stream its output to stdout"""
+    socket_path = socket_path or default_socket_path()
+    # The server resolves relative paths in argv against the caller's working directory
+    request = json.dumps({"argv": argv, "cwd": os.getcwd()}).encode("utf-8") + b"\n"
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            sock.sendall(request)
+
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.flush()
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"❌ No CLI server listening on {socket_path}. Start one with 'cli serve'.", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def main():
+    """Main entry point for the CLI client"""
+    sys.exit(send_command(sys.argv[1:]))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,6 @@
 from .ai_config import AIProviderConfig, CostTracking, PerformanceSettings
 from .profile import UserProfile, PersonalInfo, ContactInfo, Experience, Education
-from .application import Application, ApplicationStatus, FormField, FormSection
+from .application import Application, ApplicationStatus, StatusChange, FormField, FormSection
 from .form import Form, FieldMapping, FieldValidation
 
 __all__ = [
@@ -14,6 +14,7 @@ __all__ = [
     "Education",
     "Application",
     "ApplicationStatus",
+    "StatusChange",
     "FormField",
     "FormSection",
     "Form",
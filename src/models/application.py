@@ -1,9 +1,22 @@
+import sys
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field, HttpUrl, validator
+from typing import ClassVar, Deque, Dict, List, Optional, Any, Tuple, Union
+from pydantic import BaseModel, TypeAdapter, Field, HttpUrl, PrivateAttr, SkipValidation, computed_field, field_serializer, field_validator
+from typing_extensions import Annotated, TypedDict
 from enum import Enum
 
 
+_now = datetime.now
+
+# Built once; URLs are stored as plain strings and only parsed on demand
+_HTTP_URL_ADAPTER = TypeAdapter(HttpUrl)
+
+# Free-form blobs are stored as given; walking them on every load buys nothing
+RawDict = Annotated[Dict[str, Any], SkipValidation]
+
+
 class ApplicationStatus(str, Enum):
     DRAFT = "draft"
     IN_PROGRESS = "in_progress"
@@ -16,6 +29,21 @@ class ApplicationStatus(str, Enum):
     WITHDRAWN = "withdrawn"
 
 
+# Enum members are singletons, so hot-path checks can use identity
+_STATUS_SUBMITTED = ApplicationStatus.SUBMITTED
+
+
+@dataclass
+class StatusChange:
+    """Single transition recorded in an application's status history"""
+    __slots__ = ("timestamp", "from_status", "to_status", "note")
+    
+    timestamp: datetime
+    from_status: ApplicationStatus
+    to_status: ApplicationStatus
+    note: Optional[str]
+
+
 class FieldType(str, Enum):
     TEXT = "text"
     EMAIL = "email"
@@ -32,10 +60,11 @@ class FieldType(str, Enum):
     PASSWORD = "password"
 
 
-class ValidationRule(BaseModel):
-    rule_type: str = Field(..., description="Type of validation rule")
-    value: Any = Field(..., description="Validation value/pattern")
-    message: str = Field(..., description="Error message if validation fails")
+class ValidationRule(TypedDict):
+    """Validation rule attached to a form field (validated as a plain dict)"""
+    rule_type: str  # Type of validation rule
+    value: Any  # Validation value/pattern
+    message: str  # Error message if validation fails
 
 
 class FormField(BaseModel):
@@ -82,6 +111,11 @@ class FormField(BaseModel):
     # Special Requirements
     custom_validation: Optional[str] = Field(None, description="Custom validation requirements")
     requires_human_input: bool = Field(default=False, description="Requires manual input/review")
+    
+    @field_validator("field_id", mode="after")
+    @classmethod
+    def intern_field_id(cls, v: str) -> str:
+        return sys.intern(v)
 
 
 class FormSection(BaseModel):
@@ -99,12 +133,57 @@ class FormSection(BaseModel):
     # Conditional Logic
     show_conditions: Optional[Dict[str, Any]] = Field(None, description="Conditions for showing section")
     dependency_fields: List[str] = Field(default_factory=list, description="Fields this section depends on")
+    
+    @field_validator("section_id", mode="after")
+    @classmethod
+    def intern_section_id(cls, v: str) -> str:
+        return sys.intern(v)
+
+
+def _index_fields(sections: List[FormSection]) -> Dict[str, Tuple[int, int]]:
+    """Map each field_id to the (section index, field index) of its first occurrence"""
+    index = {}
+    for section_idx, section in enumerate(sections):
+        for field_idx, field in enumerate(section.fields):
+            index.setdefault(field.field_id, (section_idx, field_idx))
+    return index
+
+
+def _lookup_field(sections: List[FormSection], index: Dict[str, Tuple[int, int]], field_id: str) -> Optional[FormField]:
+    """Resolve a field through a position index, returning None if the entry is missing or stale"""
+    position = index.get(field_id)
+    if position is None:
+        return None
+    section_idx, field_idx = position
+    try:
+        field = sections[section_idx].fields[field_idx]
+    except IndexError:
+        return None
+    return field if field.field_id == field_id else None
+
+
+def _index_by(items: List[Any], id_attr: str) -> Dict[str, int]:
+    """Map each item's identifier attribute to the list position of its first occurrence"""
+    index = {}
+    for i, item in enumerate(items):
+        index.setdefault(getattr(item, id_attr), i)
+    return index
+
+
+def _lookup_indexed(items: List[Any], index: Dict[str, int], item_id: str, id_attr: str) -> Optional[Any]:
+    """Resolve an item through a position index, returning None if the entry is missing or stale"""
+    idx = index.get(item_id)
+    if idx is not None and idx < len(items):
+        item = items[idx]
+        if getattr(item, id_attr) == item_id:
+            return item
+    return None
 
 
 class JobDetails(BaseModel):
     job_title: str = Field(..., description="Job title/position")
     company_name: str = Field(..., description="Company name")
-    job_url: Optional[HttpUrl] = Field(None, description="Job posting URL")
+    job_url: Optional[str] = Field(None, description="Job posting URL")
     
     # Job Information
     department: Optional[str] = Field(None, description="Department/team")
@@ -125,6 +204,18 @@ class JobDetails(BaseModel):
     company_size: Optional[str] = Field(None, description="Company size range")
     industry: Optional[str] = Field(None, description="Company industry")
     company_culture: Optional[str] = Field(None, description="Company culture description")
+    
+    _job_url_typed: Optional[Tuple[str, HttpUrl]] = PrivateAttr(default=None)
+    
+    @property
+    def job_url_typed(self) -> Optional[HttpUrl]:
+        """Job URL validated as an HttpUrl on first access"""
+        if self.job_url is None:
+            return None
+        cached = self._job_url_typed
+        if cached is None or cached[0] != self.job_url:
+            cached = self._job_url_typed = (self.job_url, _HTTP_URL_ADAPTER.validate_python(self.job_url))
+        return cached[1]
 
 
 class ApplicationMetadata(BaseModel):
@@ -154,6 +245,9 @@ class ApplicationMetadata(BaseModel):
 
 
 class Application(BaseModel):
+    # Number of most recent status transitions kept in status_history
+    MAX_STATUS_HISTORY: ClassVar[int] = 32
+    
     # Identity
     application_id: str = Field(..., description="Unique application identifier")
     profile_id: str = Field(..., description="Associated user profile ID")
@@ -165,26 +259,25 @@ class Application(BaseModel):
     
     # Status
     status: ApplicationStatus = Field(default=ApplicationStatus.DRAFT)
-    status_history: List[Dict[str, Any]] = Field(default_factory=list)
+    status_history: Deque[StatusChange] = Field(default_factory=deque, validate_default=True)
     
     # Job and Company Information
     job_details: JobDetails = Field(..., description="Job and company information")
     
     # Form Structure
     sections: List[FormSection] = Field(default_factory=list, description="Form sections")
-    form_url: Optional[HttpUrl] = Field(None, description="Application form URL")
+    form_url: Optional[str] = Field(None, description="Application form URL")
     
     # Completion Status
-    completion_percentage: float = Field(default=0.0, ge=0.0, le=100.0)
     completed_sections: List[str] = Field(default_factory=list)
     remaining_fields: List[str] = Field(default_factory=list)
     
     # Files
-    uploaded_files: Dict[str, str] = Field(default_factory=dict, description="Uploaded file paths")
+    uploaded_files: RawDict = Field(default_factory=dict, description="Uploaded file paths")
     
     # AI Processing
-    ai_suggestions: Dict[str, Any] = Field(default_factory=dict, description="AI suggestions for responses")
-    field_mappings: Dict[str, str] = Field(default_factory=dict, description="Field to profile mappings")
+    ai_suggestions: RawDict = Field(default_factory=dict, description="AI suggestions for responses")
+    field_mappings: RawDict = Field(default_factory=dict, description="Field to profile mappings")
     
     # Metadata
     metadata: ApplicationMetadata = Field(default_factory=ApplicationMetadata)
@@ -197,103 +290,147 @@ class Application(BaseModel):
     follow_up_date: Optional[datetime] = Field(None)
     interview_dates: List[datetime] = Field(default_factory=list)
     
+    # Lookup indexes, built lazily and rebuilt when an entry goes stale
+    _field_index: Dict[str, Tuple[int, int]] = PrivateAttr(default_factory=dict)
+    _section_index: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _form_url_typed: Optional[Tuple[str, HttpUrl]] = PrivateAttr(default=None)
+    
+    @field_validator("status_history", mode="after")
+    @classmethod
+    def bound_status_history(cls, v: Deque[StatusChange]) -> Deque[StatusChange]:
+        if v.maxlen == cls.MAX_STATUS_HISTORY:
+            return v
+        return deque(v, maxlen=cls.MAX_STATUS_HISTORY)
+    
+    @field_serializer("status_history")
+    def serialize_status_history(self, v: Deque[StatusChange]) -> List[StatusChange]:
+        return list(v)
+    
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> "Application":
+        """Load a persisted application straight from JSON
+        
+        Prefer this over Application.model_validate(json.loads(...)): pydantic-core
+        parses and validates in one step without building an intermediate dict.
+        """
+        return APPLICATION_ADAPTER.validate_json(data)
+    
+    @property
+    def form_url_typed(self) -> Optional[HttpUrl]:
+        """Form URL validated as an HttpUrl on first access"""
+        if self.form_url is None:
+            return None
+        cached = self._form_url_typed
+        if cached is None or cached[0] != self.form_url:
+            cached = self._form_url_typed = (self.form_url, _HTTP_URL_ADAPTER.validate_python(self.form_url))
+        return cached[1]
+    
     def update_status(self, new_status: ApplicationStatus, note: Optional[str] = None):
         """Update application status with history tracking"""
         old_status = self.status
         self.status = new_status
-        self.updated_at = datetime.now()
+        self.updated_at = _now()
         
         # Add to status history
-        history_entry = {
-            "timestamp": self.updated_at,
-            "from_status": old_status,
-            "to_status": new_status,
-            "note": note
-        }
-        self.status_history.append(history_entry)
+        self.status_history.append(StatusChange(self.updated_at, old_status, new_status, note))
         
         # Set submitted timestamp
-        if new_status == ApplicationStatus.SUBMITTED and not self.submitted_at:
+        if new_status is _STATUS_SUBMITTED and not self.submitted_at:
             self.submitted_at = self.updated_at
     
-    def calculate_completion_percentage(self) -> float:
-        """Calculate completion percentage based on filled required fields"""
-        if not self.sections:
-            return 0.0
-        
-        total_required = 0
-        completed_required = 0
+    def _scan_fields(self) -> Tuple[int, int, List[FormField], List[FormField]]:
+        """Walk all fields once, returning (total_required, completed_required, required, incomplete)"""
+        required_fields = []
+        incomplete_fields = []
         
         for section in self.sections:
             for field in section.fields:
                 if field.required:
-                    total_required += 1
-                    if field.value is not None and field.value != "":
-                        completed_required += 1
+                    required_fields.append(field)
+                    value = field.value
+                    if value is None or value == "":
+                        incomplete_fields.append(field)
+        
+        total_required = len(required_fields)
+        return total_required, total_required - len(incomplete_fields), required_fields, incomplete_fields
+    
+    @computed_field
+    @property
+    def completion_percentage(self) -> float:
+        """Completion percentage based on filled required fields"""
+        if not self.sections:
+            return 0.0
+        
+        total_required, completed_required, _, _ = self._scan_fields()
         
         if total_required == 0:
             return 100.0
         
-        percentage = (completed_required / total_required) * 100.0
-        self.completion_percentage = round(percentage, 1)
+        return round((completed_required / total_required) * 100.0, 1)
+    
+    def calculate_completion_percentage(self) -> float:
+        """Calculate completion percentage based on filled required fields"""
         return self.completion_percentage
     
     def get_field_by_id(self, field_id: str) -> Optional[FormField]:
         """Get field by ID across all sections"""
-        for section in self.sections:
-            for field in section.fields:
-                if field.field_id == field_id:
-                    return field
-        return None
+        field = _lookup_field(self.sections, self._field_index, field_id)
+        if field is None:
+            self._field_index = _index_fields(self.sections)
+            field = _lookup_field(self.sections, self._field_index, field_id)
+        return field
     
     def get_section_by_id(self, section_id: str) -> Optional[FormSection]:
         """Get section by ID"""
-        for section in self.sections:
-            if section.section_id == section_id:
-                return section
-        return None
+        section = _lookup_indexed(self.sections, self._section_index, section_id, "section_id")
+        if section is None:
+            self._section_index = _index_by(self.sections, "section_id")
+            section = _lookup_indexed(self.sections, self._section_index, section_id, "section_id")
+        return section
     
     def get_required_fields(self) -> List[FormField]:
         """Get all required fields"""
-        required_fields = []
-        for section in self.sections:
-            for field in section.fields:
-                if field.required:
-                    required_fields.append(field)
-        return required_fields
+        return self._scan_fields()[2]
     
     def get_incomplete_fields(self) -> List[FormField]:
         """Get incomplete required fields"""
-        incomplete = []
-        for section in self.sections:
-            for field in section.fields:
-                if field.required and (field.value is None or field.value == ""):
-                    incomplete.append(field)
-        return incomplete
+        return self._scan_fields()[3]
     
     def add_ai_suggestion(self, field_id: str, suggestion: Dict[str, Any]):
         """Add AI suggestion for a field"""
         self.ai_suggestions[field_id] = suggestion
-        self.updated_at = datetime.now()
+        self.updated_at = _now()
     
     def set_field_mapping(self, field_id: str, profile_path: str):
         """Set field to profile mapping"""
         self.field_mappings[field_id] = profile_path
-        self.updated_at = datetime.now()
+        self.updated_at = _now()
     
     def is_ready_for_submission(self) -> bool:
         """Check if application is ready for submission"""
-        incomplete_fields = self.get_incomplete_fields()
-        return len(incomplete_fields) == 0
+        total_required, completed_required, _, _ = self._scan_fields()
+        return total_required == completed_required
+    
+    def days_since(self, now: Optional[datetime] = None) -> int:
+        """Get number of days since creation, as of `now` (pass one value per batch)"""
+        return ((now or _now()) - self.created_at).days
+    
+    def is_overdue_as_of(self, now: Optional[datetime] = None) -> bool:
+        """Check whether the deadline has passed as of `now` (pass one value per batch)"""
+        deadline = self.metadata.application_deadline
+        if not deadline:
+            return False
+        return (now or _now()) > deadline
     
     @property 
     def days_since_created(self) -> int:
         """Get number of days since application was created"""
-        return (datetime.now() - self.created_at).days
+        return self.days_since()
     
     @property
     def is_overdue(self) -> bool:
         """Check if application is overdue based on deadline"""
-        if not self.metadata.application_deadline:
-            return False
-        return datetime.now() > self.metadata.application_deadline
\ No newline at end of file
+        return self.is_overdue_as_of()
+
+
+APPLICATION_ADAPTER = TypeAdapter(Application)
@@ -1,9 +1,17 @@
+import math
+import re
+import sys
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field, validator
+from functools import lru_cache
+from typing import Dict, List, Literal, Optional, Any, Pattern, Tuple, Union
+from pydantic import BaseModel, TypeAdapter, Field, PrivateAttr, computed_field, field_validator, model_validator
 from enum import Enum
 
-from .application import FormField, FormSection, FieldType
+from .application import FormField, FormSection, FieldType, RawDict, _index_fields, _lookup_field
+
+
+_now = datetime.now
 
 
 class FormAnalysisType(str, Enum):
@@ -12,6 +20,21 @@ class FormAnalysisType(str, Enum):
     COMPREHENSIVE = "comprehensive"
 
 
+# Enum members are singletons, so hot-path checks can use identity
+_FT_FILE = FieldType.FILE
+_FT_TEXTAREA = FieldType.TEXTAREA
+
+
+IssueSeverity = Literal["low", "medium", "high", "critical"]
+_BLOCKING_SEVERITIES = frozenset(("high", "critical"))
+
+
+@lru_cache(maxsize=512)
+def _compile(pattern: str) -> Pattern:
+    """Compile a validation pattern once and share it across FieldValidation instances"""
+    return re.compile(pattern)
+
+
 class FieldMappingConfidence(str, Enum):
     LOW = "low"          # 0-40%
     MEDIUM = "medium"    # 41-70%
@@ -19,6 +42,18 @@ class FieldMappingConfidence(str, Enum):
     VERY_HIGH = "very_high"  # 91-100%
 
 
+# Confidence level for each whole-number score 0-100 (scores are rounded up first)
+_CONF_LEVELS = (
+    (FieldMappingConfidence.LOW,) * 41
+    + (FieldMappingConfidence.MEDIUM,) * 30
+    + (FieldMappingConfidence.HIGH,) * 20
+    + (FieldMappingConfidence.VERY_HIGH,) * 10
+)
+
+
+_HIGH_CONFIDENCE = frozenset((FieldMappingConfidence.HIGH, FieldMappingConfidence.VERY_HIGH))
+
+
 class MappingSource(str, Enum):
     AI_ANALYSIS = "ai_analysis"
     FUZZY_MATCHING = "fuzzy_matching" 
@@ -34,7 +69,6 @@ class FieldMapping(BaseModel):
     
     # Mapping Quality
     confidence_score: float = Field(..., ge=0.0, le=100.0, description="Confidence in mapping")
-    confidence_level: FieldMappingConfidence = Field(..., description="Confidence level category")
     mapping_source: MappingSource = Field(..., description="How mapping was determined")
     
     # Context Information
@@ -60,17 +94,16 @@ class FieldMapping(BaseModel):
     success_rate: Optional[float] = Field(None, ge=0.0, le=100.0)
     usage_count: int = Field(default=0, description="How many times this mapping was used")
     
-    @validator('confidence_level')
-    def set_confidence_level(cls, v, values):
-        score = values.get('confidence_score', 0)
-        if score <= 40:
-            return FieldMappingConfidence.LOW
-        elif score <= 70:
-            return FieldMappingConfidence.MEDIUM
-        elif score <= 90:
-            return FieldMappingConfidence.HIGH
-        else:
-            return FieldMappingConfidence.VERY_HIGH
+    @field_validator("field_id", mode="after")
+    @classmethod
+    def intern_field_id(cls, v: str) -> str:
+        return sys.intern(v)
+    
+    @computed_field
+    @property
+    def confidence_level(self) -> FieldMappingConfidence:
+        """Confidence level category derived from confidence_score"""
+        return _CONF_LEVELS[min(math.ceil(self.confidence_score), 100)]
 
 
 class FieldValidation(BaseModel):
@@ -92,6 +125,18 @@ class FieldValidation(BaseModel):
     max_file_size: Optional[int] = None
     allowed_file_types: List[str] = Field(default_factory=list)
     
+    _compiled_pattern: Optional[Pattern] = PrivateAttr(default=None)
+    
+    @field_validator("field_id", mode="after")
+    @classmethod
+    def intern_field_id(cls, v: str) -> str:
+        return sys.intern(v)
+    
+    @model_validator(mode="after")
+    def compile_pattern(self):
+        self._compiled_pattern = _compile(self.pattern) if self.pattern else None
+        return self
+    
     def validate_value(self, value: Any) -> tuple[bool, Optional[str]]:
         """Validate a value against this field's rules"""
         if self.required and (value is None or value == ""):
@@ -109,8 +154,11 @@ class FieldValidation(BaseModel):
                 return False, f"Maximum length is {self.max_length} characters"
             
             if self.pattern:
-                import re
-                if not re.match(self.pattern, value):
+                compiled = self._compiled_pattern
+                if compiled is None or compiled.pattern != self.pattern:
+                    # Pattern was reassigned after construction
+                    compiled = self._compiled_pattern = _compile(self.pattern)
+                if not compiled.match(value):
                     return False, self.error_message or "Invalid format"
         
         # Allowed values
@@ -120,6 +168,15 @@ class FieldValidation(BaseModel):
         return True, None
 
 
+def _item_field_id(item: Any) -> str:
+    """Read field_id from a mapping/validation given as a model or a raw dict"""
+    field_id = item.get("field_id") if isinstance(item, dict) else getattr(item, "field_id", None)
+    if field_id is None:
+        # ValueError, so pydantic reports it as a ValidationError
+        raise ValueError("Legacy list entry has no field_id")
+    return field_id
+
+
 class FormMetadata(BaseModel):
     # Form Identity
     form_url: Optional[str] = Field(None, description="Source URL of form")
@@ -174,17 +231,19 @@ class CompletionStrategy(BaseModel):
 class FormIssue(BaseModel):
     issue_type: str = Field(..., description="Type of issue")
     field_id: Optional[str] = Field(None, description="Related field ID")
-    severity: str = Field(..., description="Issue severity: low, medium, high, critical")
+    severity: IssueSeverity = Field(..., description="Issue severity: low, medium, high, critical")
     
     message: str = Field(..., description="Issue description")
     suggestion: Optional[str] = Field(None, description="Suggested resolution")
     
     # Technical Details
-    technical_details: Optional[Dict[str, Any]] = Field(None)
+    technical_details: Optional[RawDict] = Field(None)
     
+    @computed_field
+    @property
     def is_blocking(self) -> bool:
         """Check if this issue prevents form completion"""
-        return self.severity in ["high", "critical"]
+        return self.severity in _BLOCKING_SEVERITIES
 
 
 class Form(BaseModel):
@@ -202,8 +261,8 @@ class Form(BaseModel):
     metadata: FormMetadata = Field(default_factory=FormMetadata)
     
     # Analysis Results
-    field_mappings: List[FieldMapping] = Field(default_factory=list)
-    validations: List[FieldValidation] = Field(default_factory=list)
+    field_mappings: Dict[str, FieldMapping] = Field(default_factory=dict, description="Mappings keyed by field_id")
+    validations: Dict[str, FieldValidation] = Field(default_factory=dict, description="Validations keyed by field_id")
     completion_strategy: CompletionStrategy = Field(default_factory=CompletionStrategy)
     
     # Issues and Warnings
@@ -218,94 +277,90 @@ class Form(BaseModel):
     failed_submissions: int = Field(default=0)
     user_feedback: List[Dict[str, Any]] = Field(default_factory=list)
     
+    # Lookup index, built lazily and rebuilt when an entry goes stale
+    _field_index: Dict[str, Tuple[int, int]] = PrivateAttr(default_factory=dict)
+    
+    @model_validator(mode="before")
+    @classmethod
+    def key_legacy_lists(cls, data: Any) -> Any:
+        """Accept forms saved when mappings and validations were stored as lists"""
+        if isinstance(data, dict):
+            for key in ("field_mappings", "validations"):
+                items = data.get(key)
+                if isinstance(items, list):
+                    data = {**data, key: {_item_field_id(item): item for item in items}}
+        return data
+    
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> "Form":
+        """Load a persisted form straight from JSON
+        
+        Prefer this over Form.model_validate(json.loads(...)): pydantic-core
+        parses and validates in one step without building an intermediate dict.
+        """
+        return FORM_ADAPTER.validate_json(data)
+    
     def add_field_mapping(self, mapping: FieldMapping):
         """Add or update field mapping"""
-        # Remove existing mapping for same field
-        self.field_mappings = [m for m in self.field_mappings if m.field_id != mapping.field_id]
-        self.field_mappings.append(mapping)
-        self.updated_at = datetime.now()
+        self.field_mappings[mapping.field_id] = mapping
+        self.updated_at = _now()
     
     def get_mapping_for_field(self, field_id: str) -> Optional[FieldMapping]:
         """Get mapping for specific field"""
-        for mapping in self.field_mappings:
-            if mapping.field_id == field_id:
-                return mapping
-        return None
+        return self.field_mappings.get(field_id)
     
     def get_high_confidence_mappings(self) -> List[FieldMapping]:
         """Get mappings with high confidence"""
-        return [m for m in self.field_mappings 
-                if m.confidence_level in [FieldMappingConfidence.HIGH, FieldMappingConfidence.VERY_HIGH]]
+        return [m for m in self.field_mappings.values() if m.confidence_level in _HIGH_CONFIDENCE]
     
     def add_validation(self, validation: FieldValidation):
         """Add field validation rule"""
-        # Remove existing validation for same field
-        self.validations = [v for v in self.validations if v.field_id != validation.field_id]
-        self.validations.append(validation)
-        self.updated_at = datetime.now()
+        self.validations[validation.field_id] = validation
+        self.updated_at = _now()
     
     def get_validation_for_field(self, field_id: str) -> Optional[FieldValidation]:
         """Get validation rules for field"""
-        for validation in self.validations:
-            if validation.field_id == field_id:
-                return validation
-        return None
+        return self.validations.get(field_id)
     
     def add_issue(self, issue: FormIssue):
         """Add form issue"""
         self.issues.append(issue)
-        self.updated_at = datetime.now()
+        self.updated_at = _now()
+    
+    def _add_issue_unstamped(self, issue: FormIssue):
+        """Add form issue without touching updated_at (batch callers stamp once)"""
+        self.issues.append(issue)
     
     def get_blocking_issues(self) -> List[FormIssue]:
         """Get issues that block form completion"""
-        return [issue for issue in self.issues if issue.is_blocking()]
+        return [issue for issue in self.issues if issue.is_blocking]
     
     def calculate_complexity_score(self) -> float:
         """Calculate form complexity score (0-10)"""
-        score = 0.0
-        factors = []
-        
-        # Base complexity from field count
-        total_fields = sum(len(section.fields) for section in self.sections)
-        score += min(total_fields * 0.1, 3.0)
-        
-        if total_fields > 20:
-            factors.append("High field count")
-        
-        # File upload complexity
-        file_fields = 0
-        for section in self.sections:
-            for field in section.fields:
-                if field.field_type == FieldType.FILE:
-                    file_fields += 1
+        # Count every field type in one pass over the sections
+        type_counts = Counter(field.field_type for section in self.sections for field in section.fields)
+        total_fields = sum(type_counts.values())
+        file_fields = type_counts[_FT_FILE]
+        textarea_fields = type_counts[_FT_TEXTAREA]
+        is_multi_step = self.metadata.is_multi_step
+        required_ratio = self.metadata.required_fields / total_fields if total_fields else 0.0
         
-        if file_fields > 0:
-            score += file_fields * 0.5
-            factors.append(f"{file_fields} file upload(s)")
-        
-        # Text area complexity (essays, descriptions)
-        textarea_fields = 0
-        for section in self.sections:
-            for field in section.fields:
-                if field.field_type == FieldType.TEXTAREA:
-                    textarea_fields += 1
-        
-        if textarea_fields > 2:
-            score += 1.0
-            factors.append("Multiple essay questions")
-        
-        # Multi-step complexity
-        if self.metadata.is_multi_step:
-            score += 1.0
-            factors.append("Multi-step form")
-        
-        # Required fields ratio
-        required_count = self.metadata.required_fields
-        if total_fields > 0:
-            required_ratio = required_count / total_fields
-            if required_ratio > 0.7:
-                score += 0.5
-                factors.append("High required field ratio")
+        score = (
+            min(total_fields * 0.1, 3.0)              # Base complexity from field count
+            + file_fields * 0.5                       # File upload complexity
+            + (1.0 if textarea_fields > 2 else 0.0)   # Essays, descriptions
+            + (1.0 if is_multi_step else 0.0)
+            + (0.5 if required_ratio > 0.7 else 0.0)
+        )
+        factors = [
+            factor for factor, applies in (
+                ("High field count", total_fields > 20),
+                (f"{file_fields} file upload(s)", file_fields > 0),
+                ("Multiple essay questions", textarea_fields > 2),
+                ("Multi-step form", is_multi_step),
+                ("High required field ratio", required_ratio > 0.7),
+            ) if applies
+        ]
         
         self.metadata.complexity_score = min(score, 10.0)
         self.metadata.complexity_factors = factors
@@ -314,14 +369,22 @@ class Form(BaseModel):
     
     def get_field_by_id(self, field_id: str) -> Optional[FormField]:
         """Get field by ID"""
-        for section in self.sections:
-            for field in section.fields:
-                if field.field_id == field_id:
-                    return field
-        return None
-    
-    def update_from_analysis(self, analysis_result: Dict[str, Any]):
-        """Update form from AI analysis result"""
+        field = _lookup_field(self.sections, self._field_index, field_id)
+        if field is None:
+            self._field_index = _index_fields(self.sections)
+            field = _lookup_field(self.sections, self._field_index, field_id)
+        return field
+    
+    def update_from_analysis(self, analysis_result: Dict[str, Any], assume_valid: bool = False):
+        """Update form from AI analysis result
+        
+        Pass assume_valid=True only for payloads already shaped by our own analysis
+        pipeline; sections and issues are then built without pydantic validation.
+        """
+        now = _now()
+        build_section = FormSection.model_construct if assume_valid else FormSection
+        build_issue = FormIssue.model_construct if assume_valid else FormIssue
+        
         if "metadata" in analysis_result:
             # Update metadata
             meta = analysis_result["metadata"]
@@ -332,24 +395,32 @@ class Form(BaseModel):
         if "sections" in analysis_result:
             # Update sections and fields
             for section_data in analysis_result["sections"]:
-                section = FormSection(
+                section = build_section(
                     section_id=section_data.get("section_id", f"section_{len(self.sections)}"),
                     section_name=section_data["section_name"],
-                    section_order=section_data["section_order"]
+                    section_order=section_data["section_order"],
+                    fields=[],
+                    dependency_fields=[]
                 )
                 self.sections.append(section)
+            self._field_index.clear()
         
         if "issues" in analysis_result:
             # Add identified issues
             for issue_data in analysis_result["issues"]:
-                issue = FormIssue(
+                issue = build_issue(
                     issue_type=issue_data["issue_type"],
                     field_id=issue_data.get("field_id"),
                     severity=issue_data["severity"],
                     message=issue_data["message"],
-                    suggestion=issue_data.get("suggestion")
+                    suggestion=issue_data.get("suggestion"),
+                    technical_details=None
                 )
-                self.add_issue(issue)
+                self._add_issue_unstamped(issue)
         
-        self.last_analyzed = datetime.now()
-        self.ai_analysis_complete = True
\ No newline at end of file
+        self.updated_at = now
+        self.last_analyzed = now
+        self.ai_analysis_complete = True
+
+
+FORM_ADAPTER = TypeAdapter(Form)
@@ -26,10 +26,22 @@ License: MIT
 """
 
 import asyncio
+import hashlib
 import json
+import logging
+import logging.handlers
 import os
+import queue
+import sys
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from mcp.server import Server
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
@@ -40,7 +52,7 @@ from .models.profile import UserProfile
 from .models.application import Application, JobDetails
 from .models.form import Form
 from .services.ai_service import AIService
-from .services.deepseek_service import DeepSeekService
+from .services.deepseek_service import DeepSeekService, get_shared_http_client, close_shared_http_client
 from .services.local_service import LocalService
 from .services.basic_matching_service import BasicMatchingService
 from .services.semantic_matcher import SemanticMatcher
@@ -51,6 +63,234 @@ from .utils.storage import StorageManager
 from .utils.paths import PathManager
 
 
+logger = logging.getLogger(__name__)
+
+
+def _start_stderr_logging() -> logging.handlers.QueueListener:
+    """Route log records to stderr through a queue so stdout stays free for MCP frames"""
+    log_queue: queue.Queue = queue.Queue()
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    
+    listener = logging.handlers.QueueListener(log_queue, stderr_handler)
+    listener.start()
+    return listener
+
+
+def _content_key(obj: Any) -> str:
+    """Stable digest of a JSON-like payload, independent of key order"""
+    if orjson is not None:
+        canonical = orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        canonical = json.dumps(obj, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+# Results this small with only scalar values skip indentation
+_SMALL_RESULT_KEYS = 3
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_small_result(obj: Any) -> bool:
+    """Check for flat placeholder-style results such as {"success": ..., "message": ...}"""
+    return (
+        isinstance(obj, dict)
+        and len(obj) <= _SMALL_RESULT_KEYS
+        and all(isinstance(v, _SCALAR_TYPES) for v in obj.values())
+    )
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result to indented JSON, using orjson when it is installed"""
+    if _is_small_result(obj):
+        if orjson is not None:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(obj)
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
+# Validated once; responses are shallow copies with only the text swapped in
+_TEXT_CONTENT_PROTO = TextContent(type="text", text="")
+
+
+def _text_content(text: str) -> TextContent:
+    """Wrap a tool response in TextContent without re-running pydantic validation"""
+    return _TEXT_CONTENT_PROTO.model_copy(update={"text": text})
+
+
+# Tool input schemas, shared by the tool catalog
+_CREATE_PROFILE_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "profile_data": {
+            "type": "object",
+            "description": "Complete profile information including personal, contact, experience, and preferences"
+        }
+    },
+    "required": ["profile_data"]
+})
+
+_UPDATE_PROFILE_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "profile_id": {"type": "string", "description": "Profile ID to update"},
+        "updates": {"type": "object", "description": "Profile fields to update"}
+    },
+    "required": ["profile_id", "updates"]
+})
+
+_GET_PROFILE_SCHEMA = MappingProxyType({
+    "type": "object", 
+    "properties": {
+        "profile_id": {"type": "string", "description": "Profile ID to retrieve"}
+    },
+    "required": ["profile_id"]
+})
+
+_NO_ARGS_SCHEMA = MappingProxyType({"type": "object", "properties": {}})
+
+_CONFIGURE_AI_PROVIDER_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "provider": {"type": "string", "description": "Provider name (deepseek, local)"},
+        "api_key": {"type": "string", "description": "API key for the provider"},
+        "settings": {"type": "object", "description": "Additional provider settings"}
+    },
+    "required": ["provider"]
+})
+
+_SWITCH_AI_PROVIDER_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "provider": {"type": "string", "description": "Provider name to switch to"}
+    },
+    "required": ["provider"]
+})
+
+_GET_AI_USAGE_STATS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "timeframe": {"type": "string", "enum": ["all", "today", "month"], "default": "month"}
+    }
+})
+
+_ANALYZE_FORM_WITH_AI_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "html_content": {"type": "string", "description": "HTML content of the job application form"},
+        "job_context": {"type": "object", "description": "Optional job/company context information"}
+    },
+    "required": ["html_content"]
+})
+
+_AI_MATCH_FIELDS_SCHEMA = MappingProxyType({
+    "type": "object", 
+    "properties": {
+        "form_id": {"type": "string", "description": "Form ID to match fields for"},
+        "profile_id": {"type": "string", "description": "Profile ID to match against"},
+        "job_context": {"type": "object", "description": "Optional job context for better matching"}
+    },
+    "required": ["form_id", "profile_id"]
+})
+
+_AI_GENERATE_RESPONSES_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "field_mappings": {"type": "object", "description": "Field to profile mappings"},
+        "profile_id": {"type": "string", "description": "User profile ID"},
+        "job_context": {"type": "object", "description": "Job and company context"}
+    },
+    "required": ["field_mappings", "profile_id"]
+})
+
+_CREATE_APPLICATION_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "profile_id": {"type": "string", "description": "Associated profile ID"},
+        "job_details": {"type": "object", "description": "Job and company information"},
+        "form_data": {"type": "object", "description": "Form structure data"}
+    },
+    "required": ["profile_id", "job_details"]
+})
+
+_UPDATE_APPLICATION_STATUS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "application_id": {"type": "string", "description": "Application ID"},
+        "status": {"type": "string", "description": "New status"},
+        "note": {"type": "string", "description": "Optional status note"}
+    },
+    "required": ["application_id", "status"]
+})
+
+_GET_APPLICATION_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "application_id": {"type": "string", "description": "Application ID to retrieve"}
+    },
+    "required": ["application_id"]
+})
+
+_EXPORT_DATA_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "data_type": {"type": "string", "enum": ["profiles", "applications", "all"]},
+        "format": {"type": "string", "enum": ["json", "csv"], "default": "json"}
+    },
+    "required": ["data_type"]
+})
+
+
+# Parsed config files keyed by (path, mtime); a changed file gets a new key
+_config_cache: Dict[Tuple[str, float], Dict[str, Any]] = {}
+
+
+def _read_config_file(config_path: Path) -> Dict[str, Any]:
+    """Parse a JSON config file, reusing the parsed result until the file changes"""
+    key = (str(config_path), config_path.stat().st_mtime)
+    config_data = _config_cache.get(key)
+    if config_data is None:
+        with open(config_path, 'r') as f:
+            config_data = json.load(f)
+        _config_cache[key] = config_data
+    return config_data
+
+
+# AI provider type -> service class; a new provider only needs an entry here
+PROVIDER_REGISTRY: Dict[AIProviderType, Type[AIService]] = {
+    AIProviderType.DEEPSEEK: DeepSeekService,
+    AIProviderType.LOCAL: LocalService,
+    AIProviderType.BASIC_MATCHING: BasicMatchingService,
+}
+
+
+# Provider connection tests run at most this many at a time, each capped at this many seconds
+PROVIDER_PROBE_CONCURRENCY = 4
+PROVIDER_PROBE_TIMEOUT = 3.0
+
+
+# Number of validated profile payloads kept for repeat create_profile calls
+PROFILE_PARSE_CACHE_SIZE = 128
+
+
+# Tools that need AI provider initialization to have finished
+AI_TOOLS = frozenset({
+    "configure_ai_provider",
+    "switch_ai_provider",
+    "get_ai_usage_stats",
+    "analyze_form_with_ai",
+    "ai_match_fields",
+    "ai_generate_responses",
+    "test_ai_connection",
+})
+
+
 class JobApplicationAgentServer:
     """
     Main MCP server for the Job Application Agent.
@@ -82,89 +322,176 @@ class JobApplicationAgentServer:
         # Service managers
         self.storage_manager: Optional[StorageManager] = None
         self.profile_manager: Optional[ProfileManager] = None
-        self.semantic_matcher: Optional[SemanticMatcher] = None
-        self.form_analyzer: Optional[FormAnalyzer] = None
-        self.response_generator: Optional[ResponseGenerator] = None
+        
+        # AI-backed managers, created on first use (see the properties below)
+        self._semantic_matcher: Optional[SemanticMatcher] = None
+        self._form_analyzer: Optional[FormAnalyzer] = None
+        self._response_generator: Optional[ResponseGenerator] = None
         
         # Path manager
         self.path_manager = PathManager()
         
+        # Validated profiles keyed by payload digest, so resent payloads skip validation
+        self._profile_parse_cache: "OrderedDict[str, UserProfile]" = OrderedDict()
+        
+        # Set once AI provider initialization has finished (successfully or not)
+        self._providers_ready = asyncio.Event()
+        self._providers_task: Optional[asyncio.Task] = None
+        
+        # Tool name -> handler, so each call is a single lookup
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
+            # Profile Management Tools
+            "create_profile": self._create_profile,
+            "update_profile": self._update_profile,
+            "get_profile": self._get_profile,
+            "list_profiles": self._list_profiles,
+            
+            # AI Provider Tools
+            "configure_ai_provider": self._configure_ai_provider,
+            "switch_ai_provider": self._switch_ai_provider,
+            "get_ai_usage_stats": self._get_ai_usage_stats,
+            
+            # Form Analysis Tools
+            "analyze_form_with_ai": self._analyze_form_with_ai,
+            "ai_match_fields": self._ai_match_fields,
+            "ai_generate_responses": self._ai_generate_responses,
+            
+            # Application Management Tools
+            "create_application": self._create_application,
+            "update_application_status": self._update_application_status,
+            "get_application": self._get_application,
+            
+            # Utility Tools
+            "test_ai_connection": self._test_ai_connection,
+            "export_data": self._export_data,
+        }
+        
         # Register all tools
+        self._tool_catalog = self._build_tool_catalog()
         self._register_tools()
     
-    async def initialize(self):
-        """Initialize the server and load configuration"""
+    async def _quick_init(self):
+        """Load configuration and storage only; no network calls"""
+        # AI configuration and storage are independent, so load them concurrently
+        self.storage_manager = StorageManager(self.path_manager.get_data_dir())
+        await asyncio.gather(
+            self._load_ai_configuration(),
+            self.storage_manager.initialize()
+        )
+        
+        # Initialize service managers
+        self.profile_manager = ProfileManager(self.storage_manager)
+    
+    async def _initialize_ai_providers_and_managers(self):
+        """Background AI provider initialization, run once the MCP transport is up"""
         try:
-            # Load AI configuration
-            await self._load_ai_configuration()
-            
-            # Initialize storage
-            self.storage_manager = StorageManager(self.path_manager.get_data_dir())
-            await self.storage_manager.initialize()
-            
-            # Initialize AI providers
             await self._initialize_ai_providers()
-            
-            # Initialize service managers
-            self.profile_manager = ProfileManager(self.storage_manager)
-            self.semantic_matcher = SemanticMatcher(self.current_provider)
-            self.form_analyzer = FormAnalyzer(self.current_provider)
-            self.response_generator = ResponseGenerator(self.current_provider)
-            
-            print(f"🚀 Job Application Agent initialized with {self.current_provider.provider_name} AI provider")
-            
+            logger.info(f"🚀 Job Application Agent initialized with {self.current_provider.provider_name} AI provider")
         except Exception as e:
-            print(f"❌ Failed to initialize server: {str(e)}")
-            raise
+            logger.error(f"❌ Failed to initialize AI providers: {str(e)}")
+        finally:
+            self._providers_ready.set()
+    
+    def start_background_init(self):
+        """Schedule AI provider initialization without blocking the MCP handshake"""
+        self._providers_task = asyncio.create_task(self._initialize_ai_providers_and_managers())
+    
+    async def stop_background_init(self):
+        """Cancel AI provider initialization if it is still running and wait for it to unwind"""
+        task = self._providers_task
+        if task is None or task.done():
+            return
+        
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    
+    @property
+    def semantic_matcher(self) -> SemanticMatcher:
+        """AI-powered field matcher, created on first use"""
+        if self._semantic_matcher is None:
+            self._semantic_matcher = SemanticMatcher(self.current_provider)
+        return self._semantic_matcher
+    
+    @property
+    def form_analyzer(self) -> FormAnalyzer:
+        """Form analyzer, created on first use"""
+        if self._form_analyzer is None:
+            self._form_analyzer = FormAnalyzer(self.current_provider)
+        return self._form_analyzer
+    
+    @property
+    def response_generator(self) -> ResponseGenerator:
+        """Response generator, created on first use"""
+        if self._response_generator is None:
+            self._response_generator = ResponseGenerator(self.current_provider)
+        return self._response_generator
     
     async def _load_ai_configuration(self):
         """Load AI provider configuration"""
         config_path = self.path_manager.get_config_dir() / "ai_providers.json"
         
         try:
-            with open(config_path, 'r') as f:
-                config_data = json.load(f)
-            
-            # Load environment variables
-            config_data = self._inject_env_vars(config_data)
-            
-            self.config = AIConfiguration.parse_obj(config_data)
+            # File I/O and pydantic validation are blocking; keep them off the event loop
+            loop = asyncio.get_running_loop()
+            self.config = await loop.run_in_executor(None, self._parse_ai_configuration, config_path)
             
         except FileNotFoundError:
-            print("⚠️ AI configuration file not found, using defaults")
+            logger.warning("⚠️ AI configuration file not found, using defaults")
             self.config = self._create_default_config()
         except Exception as e:
-            print(f"❌ Error loading AI configuration: {str(e)}")
+            logger.error(f"❌ Error loading AI configuration: {str(e)}")
             self.config = self._create_default_config()
     
+    def _parse_ai_configuration(self, config_path: Path) -> AIConfiguration:
+        """Read, override and validate the AI configuration file (blocking)"""
+        config_data = _read_config_file(config_path)
+        
+        # Load environment variables
+        config_data = self._inject_env_vars(config_data)
+        
+        return AIConfiguration.model_validate(config_data)
+    
     def _inject_env_vars(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Inject environment variables into configuration"""
+        """Inject environment variables into a copy of the configuration
+        
+        Only the dicts that get overridden are copied, so the cached file contents
+        are never modified.
+        """
+        env = os.environ
+        config_data = dict(config_data)
+        
         # DeepSeek configuration
         if 'deepseek' in config_data.get('providers', {}):
-            deepseek_config = config_data['providers']['deepseek']
-            deepseek_config['api_key'] = os.getenv('DEEPSEEK_API_KEY', deepseek_config.get('api_key'))
-            deepseek_config['api_base'] = os.getenv('DEEPSEEK_API_BASE', deepseek_config.get('api_base'))
-            deepseek_config['model'] = os.getenv('DEEPSEEK_MODEL', deepseek_config.get('model'))
+            config_data['providers'] = dict(config_data['providers'])
+            deepseek_config = config_data['providers']['deepseek'] = dict(config_data['providers']['deepseek'])
+            deepseek_config['api_key'] = env.get('DEEPSEEK_API_KEY', deepseek_config.get('api_key'))
+            deepseek_config['api_base'] = env.get('DEEPSEEK_API_BASE', deepseek_config.get('api_base'))
+            deepseek_config['model'] = env.get('DEEPSEEK_MODEL', deepseek_config.get('model'))
         
         # Default provider
-        config_data['default_provider'] = os.getenv('DEFAULT_AI_PROVIDER', config_data.get('default_provider'))
+        config_data['default_provider'] = env.get('DEFAULT_AI_PROVIDER', config_data.get('default_provider'))
         
         # Budget settings
         if 'cost_tracking' in config_data:
-            cost_config = config_data['cost_tracking']
-            if os.getenv('MONTHLY_BUDGET_USD'):
-                cost_config['monthly_budget'] = float(os.getenv('MONTHLY_BUDGET_USD'))
+            cost_config = config_data['cost_tracking'] = dict(config_data['cost_tracking'])
+            monthly_budget = env.get('MONTHLY_BUDGET_USD')
+            if monthly_budget:
+                cost_config['monthly_budget'] = float(monthly_budget)
         
         return config_data
     
     def _create_default_config(self) -> AIConfiguration:
         """Create default AI configuration"""
+        env = os.environ
         deepseek_config = AIProviderConfig(
             name="DeepSeek",
             provider_type=AIProviderType.DEEPSEEK,
             model="deepseek-chat",
-            api_key=os.getenv('DEEPSEEK_API_KEY', ''),
-            api_base=os.getenv('DEEPSEEK_API_BASE', 'https://api.deepseek.com/v1'),
+            api_key=env.get('DEEPSEEK_API_KEY', ''),
+            api_base=env.get('DEEPSEEK_API_BASE', 'https://api.deepseek.com/v1'),
             cost_per_1k_input=0.00014,
             cost_per_1k_output=0.00028
         )
@@ -196,29 +523,45 @@ class JobApplicationAgentServer:
     
     async def _initialize_ai_providers(self):
         """Initialize AI providers based on configuration"""
+        # Every provider shares one connection pool, so concurrent connection tests reuse TLS sessions
+        http_client = get_shared_http_client()
+        candidates: List[Tuple[str, AIService]] = []
         for provider_name, provider_config in self.config.providers.items():
             if not provider_config.enabled:
                 continue
             
+            service_class = PROVIDER_REGISTRY.get(provider_config.provider_type)
+            if service_class is None:
+                continue  # Skip unsupported providers for now
+            
             try:
-                if provider_config.provider_type == AIProviderType.DEEPSEEK:
-                    service = DeepSeekService(provider_config.dict())
-                elif provider_config.provider_type == AIProviderType.LOCAL:
-                    service = LocalService(provider_config.dict())
-                elif provider_config.provider_type == AIProviderType.BASIC_MATCHING:
-                    service = BasicMatchingService(provider_config.dict())
-                else:
-                    continue  # Skip unsupported providers for now
-                
-                # Test connection
-                if await service.test_connection():
-                    self.ai_providers[provider_name] = service
-                    print(f"✅ {provider_name} provider initialized")
-                else:
-                    print(f"⚠️ {provider_name} provider connection failed")
-                    
+                service = service_class(provider_config, http_client=http_client)
+                candidates.append((provider_name, service))
             except Exception as e:
-                print(f"❌ Failed to initialize {provider_name} provider: {str(e)}")
+                logger.error(f"❌ Failed to initialize {provider_name} provider: {str(e)}")
+        
+        # Test connections concurrently but bounded, so a hanging provider can't stall startup
+        probe_slots = asyncio.Semaphore(PROVIDER_PROBE_CONCURRENCY)
+        
+        async def probe(service: AIService) -> bool:
+            async with probe_slots:
+                return await asyncio.wait_for(service.test_connection(), PROVIDER_PROBE_TIMEOUT)
+        
+        results = await asyncio.gather(
+            *(probe(service) for _, service in candidates),
+            return_exceptions=True
+        )
+        
+        for (provider_name, service), connected in zip(candidates, results):
+            if isinstance(connected, asyncio.TimeoutError):
+                logger.warning(f"⚠️ {provider_name} provider connection timed out after {PROVIDER_PROBE_TIMEOUT}s")
+            elif isinstance(connected, Exception):
+                logger.error(f"❌ Failed to initialize {provider_name} provider: {str(connected)}")
+            elif connected:
+                self.ai_providers[provider_name] = service
+                logger.info(f"✅ {provider_name} provider initialized")
+            else:
+                logger.warning(f"⚠️ {provider_name} provider connection failed")
         
         # Set current provider
         default_provider = self.config.default_provider
@@ -230,192 +573,102 @@ class JobApplicationAgentServer:
         else:
             raise Exception("No AI providers available")
     
+    def _build_tool_catalog(self) -> List[Tool]:
+        """Build the MCP tool list once; list_tools returns it as-is"""
+        return [
+            # Profile Management
+            Tool(
+                name="create_profile",
+                description="Create a new user profile with personal and professional information",
+                inputSchema=_CREATE_PROFILE_SCHEMA
+            ),
+            Tool(
+                name="update_profile", 
+                description="Update an existing user profile",
+                inputSchema=_UPDATE_PROFILE_SCHEMA
+            ),
+            Tool(
+                name="get_profile",
+                description="Retrieve a user profile by ID",
+                inputSchema=_GET_PROFILE_SCHEMA
+            ),
+            Tool(
+                name="list_profiles",
+                description="List all user profiles",
+                inputSchema=_NO_ARGS_SCHEMA
+            ),
+            
+            # AI Provider Management
+            Tool(
+                name="configure_ai_provider",
+                description="Configure AI provider settings",
+                inputSchema=_CONFIGURE_AI_PROVIDER_SCHEMA
+            ),
+            Tool(
+                name="switch_ai_provider",
+                description="Switch to a different AI provider",
+                inputSchema=_SWITCH_AI_PROVIDER_SCHEMA
+            ),
+            Tool(
+                name="get_ai_usage_stats",
+                description="Get AI usage statistics and costs",
+                inputSchema=_GET_AI_USAGE_STATS_SCHEMA
+            ),
+            
+            # Form Analysis Tools
+            Tool(
+                name="analyze_form_with_ai",
+                description="Analyze job application form HTML with AI to extract fields and structure",
+                inputSchema=_ANALYZE_FORM_WITH_AI_SCHEMA
+            ),
+            Tool(
+                name="ai_match_fields",
+                description="Use AI to match form fields to user profile data",
+                inputSchema=_AI_MATCH_FIELDS_SCHEMA
+            ),
+            Tool(
+                name="ai_generate_responses", 
+                description="Generate AI responses for form fields based on profile and job context",
+                inputSchema=_AI_GENERATE_RESPONSES_SCHEMA
+            ),
+            
+            # Application Management
+            Tool(
+                name="create_application",
+                description="Create a new job application",
+                inputSchema=_CREATE_APPLICATION_SCHEMA
+            ),
+            Tool(
+                name="update_application_status",
+                description="Update application status",
+                inputSchema=_UPDATE_APPLICATION_STATUS_SCHEMA
+            ),
+            Tool(
+                name="get_application",
+                description="Get application details",
+                inputSchema=_GET_APPLICATION_SCHEMA
+            ),
+            
+            # Utility Tools
+            Tool(
+                name="test_ai_connection",
+                description="Test connection to current AI provider",
+                inputSchema=_NO_ARGS_SCHEMA
+            ),
+            Tool(
+                name="export_data",
+                description="Export user data (profiles, applications, etc.)",
+                inputSchema=_EXPORT_DATA_SCHEMA
+            )
+        ]
+    
     def _register_tools(self):
         """Register all MCP tools"""
         
-        # Profile Management Tools
         @self.server.list_tools()
         async def handle_list_tools() -> List[Tool]:
             """List all available tools"""
-            return [
-                # Profile Management
-                Tool(
-                    name="create_profile",
-                    description="Create a new user profile with personal and professional information",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "profile_data": {
-                                "type": "object",
-                                "description": "Complete profile information including personal, contact, experience, and preferences"
-                            }
-                        },
-                        "required": ["profile_data"]
-                    }
-                ),
-                Tool(
-                    name="update_profile", 
-                    description="Update an existing user profile",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "profile_id": {"type": "string", "description": "Profile ID to update"},
-                            "updates": {"type": "object", "description": "Profile fields to update"}
-                        },
-                        "required": ["profile_id", "updates"]
-                    }
-                ),
-                Tool(
-                    name="get_profile",
-                    description="Retrieve a user profile by ID",
-                    inputSchema={
-                        "type": "object", 
-                        "properties": {
-                            "profile_id": {"type": "string", "description": "Profile ID to retrieve"}
-                        },
-                        "required": ["profile_id"]
-                    }
-                ),
-                Tool(
-                    name="list_profiles",
-                    description="List all user profiles",
-                    inputSchema={"type": "object", "properties": {}}
-                ),
-                
-                # AI Provider Management
-                Tool(
-                    name="configure_ai_provider",
-                    description="Configure AI provider settings",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "provider": {"type": "string", "description": "Provider name (deepseek, local)"},
-                            "api_key": {"type": "string", "description": "API key for the provider"},
-                            "settings": {"type": "object", "description": "Additional provider settings"}
-                        },
-                        "required": ["provider"]
-                    }
-                ),
-                Tool(
-                    name="switch_ai_provider",
-                    description="Switch to a different AI provider",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "provider": {"type": "string", "description": "Provider name to switch to"}
-                        },
-                        "required": ["provider"]
-                    }
-                ),
-                Tool(
-                    name="get_ai_usage_stats",
-                    description="Get AI usage statistics and costs",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "timeframe": {"type": "string", "enum": ["all", "today", "month"], "default": "month"}
-                        }
-                    }
-                ),
-                
-                # Form Analysis Tools
-                Tool(
-                    name="analyze_form_with_ai",
-                    description="Analyze job application form HTML with AI to extract fields and structure",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "html_content": {"type": "string", "description": "HTML content of the job application form"},
-                            "job_context": {"type": "object", "description": "Optional job/company context information"}
-                        },
-                        "required": ["html_content"]
-                    }
-                ),
-                Tool(
-                    name="ai_match_fields",
-                    description="Use AI to match form fields to user profile data",
-                    inputSchema={
-                        "type": "object", 
-                        "properties": {
-                            "form_id": {"type": "string", "description": "Form ID to match fields for"},
-                            "profile_id": {"type": "string", "description": "Profile ID to match against"},
-                            "job_context": {"type": "object", "description": "Optional job context for better matching"}
-                        },
-                        "required": ["form_id", "profile_id"]
-                    }
-                ),
-                Tool(
-                    name="ai_generate_responses", 
-                    description="Generate AI responses for form fields based on profile and job context",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "field_mappings": {"type": "object", "description": "Field to profile mappings"},
-                            "profile_id": {"type": "string", "description": "User profile ID"},
-                            "job_context": {"type": "object", "description": "Job and company context"}
-                        },
-                        "required": ["field_mappings", "profile_id"]
-                    }
-                ),
-                
-                # Application Management
-                Tool(
-                    name="create_application",
-                    description="Create a new job application",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "profile_id": {"type": "string", "description": "Associated profile ID"},
-                            "job_details": {"type": "object", "description": "Job and company information"},
-                            "form_data": {"type": "object", "description": "Form structure data"}
-                        },
-                        "required": ["profile_id", "job_details"]
-                    }
-                ),
-                Tool(
-                    name="update_application_status",
-                    description="Update application status",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "application_id": {"type": "string", "description": "Application ID"},
-                            "status": {"type": "string", "description": "New status"},
-                            "note": {"type": "string", "description": "Optional status note"}
-                        },
-                        "required": ["application_id", "status"]
-                    }
-                ),
-                Tool(
-                    name="get_application",
-                    description="Get application details",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "application_id": {"type": "string", "description": "Application ID to retrieve"}
-                        },
-                        "required": ["application_id"]
-                    }
-                ),
-                
-                # Utility Tools
-                Tool(
-                    name="test_ai_connection",
-                    description="Test connection to current AI provider",
-                    inputSchema={"type": "object", "properties": {}}
-                ),
-                Tool(
-                    name="export_data",
-                    description="Export user data (profiles, applications, etc.)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "data_type": {"type": "string", "enum": ["profiles", "applications", "all"]},
-                            "format": {"type": "string", "enum": ["json", "csv"], "default": "json"}
-                        },
-                        "required": ["data_type"]
-                    }
-                )
-            ]
+            return self._tool_catalog
         
         # Tool implementations
         @self.server.call_tool()
@@ -423,62 +676,26 @@ class JobApplicationAgentServer:
             """Handle tool calls"""
             try:
                 result = await self._execute_tool(name, arguments)
-                return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+                return [_text_content(_dumps(result))]
             except Exception as e:
                 error_result = {"error": str(e), "tool": name}
-                return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+                return [_text_content(_dumps(error_result))]
     
     async def _execute_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the specified tool"""
+        if name in AI_TOOLS:
+            await self._providers_ready.wait()
         
-        # Profile Management Tools
-        if name == "create_profile":
-            return await self._create_profile(arguments)
-        elif name == "update_profile":
-            return await self._update_profile(arguments)
-        elif name == "get_profile":
-            return await self._get_profile(arguments)
-        elif name == "list_profiles":
-            return await self._list_profiles()
-        
-        # AI Provider Tools
-        elif name == "configure_ai_provider":
-            return await self._configure_ai_provider(arguments)
-        elif name == "switch_ai_provider":
-            return await self._switch_ai_provider(arguments)
-        elif name == "get_ai_usage_stats":
-            return await self._get_ai_usage_stats(arguments)
-        
-        # Form Analysis Tools
-        elif name == "analyze_form_with_ai":
-            return await self._analyze_form_with_ai(arguments)
-        elif name == "ai_match_fields":
-            return await self._ai_match_fields(arguments)
-        elif name == "ai_generate_responses":
-            return await self._ai_generate_responses(arguments)
-        
-        # Application Management Tools
-        elif name == "create_application":
-            return await self._create_application(arguments)
-        elif name == "update_application_status":
-            return await self._update_application_status(arguments)
-        elif name == "get_application":
-            return await self._get_application(arguments)
-        
-        # Utility Tools
-        elif name == "test_ai_connection":
-            return await self._test_ai_connection()
-        elif name == "export_data":
-            return await self._export_data(arguments)
-        
-        else:
+        handler = self._dispatch.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
+        return await handler(arguments)
     
     # Tool implementations
     async def _create_profile(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new user profile"""
         profile_data = args["profile_data"]
-        profile = UserProfile.parse_obj(profile_data)
+        profile = self._parse_profile(profile_data)
         
         saved_profile = await self.profile_manager.create_profile(profile)
         
@@ -488,23 +705,42 @@ class JobApplicationAgentServer:
             "message": "Profile created successfully"
         }
     
+    def _parse_profile(self, profile_data: Dict[str, Any]) -> UserProfile:
+        """Validate profile data, reusing the result for a payload seen recently"""
+        cache = self._profile_parse_cache
+        key = _content_key(profile_data)
+        
+        profile = cache.get(key)
+        if profile is None:
+            profile = UserProfile.model_validate(profile_data)
+            cache[key] = profile
+            if len(cache) > PROFILE_PARSE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        
+        # Callers stamp ids and timestamps on the result; keep the cached copy pristine
+        return profile.model_copy()
+    
     async def _get_ai_usage_stats(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Get AI usage statistics"""
         timeframe = args.get("timeframe", "month")
+        provider = self.current_provider
+        config = self.config
         
-        if not self.current_provider:
+        if not provider:
             return {"error": "No AI provider available"}
         
-        stats = self.current_provider.get_usage_stats(timeframe)
+        stats = provider.get_usage_stats(timeframe)
         
         # Add budget information
         budget_info = None
-        if self.config and self.config.cost_tracking.enabled:
-            within_budget, current_cost, percentage = self.current_provider.is_within_budget(
-                self.config.cost_tracking.monthly_budget
-            )
+        cost_tracking = config.cost_tracking if config else None
+        if cost_tracking and cost_tracking.enabled:
+            monthly_budget = cost_tracking.monthly_budget
+            within_budget, current_cost, percentage = provider.is_within_budget(monthly_budget)
             budget_info = {
-                "monthly_budget": self.config.cost_tracking.monthly_budget,
+                "monthly_budget": monthly_budget,
                 "current_cost": current_cost,
                 "budget_used_percentage": percentage,
                 "within_budget": within_budget
@@ -520,10 +756,11 @@ class JobApplicationAgentServer:
         html_content = args["html_content"]
         job_context = args.get("job_context")
         
-        if not self.form_analyzer:
+        form_analyzer = self.form_analyzer
+        if not form_analyzer:
             return {"error": "Form analyzer not initialized"}
         
-        result = await self.form_analyzer.analyze_form(html_content, job_context)
+        result = await form_analyzer.analyze_form(html_content, job_context)
         
         return {
             "success": result.success,
@@ -534,18 +771,19 @@ class JobApplicationAgentServer:
             "estimated_cost": result.estimated_cost
         }
     
-    async def _test_ai_connection(self) -> Dict[str, Any]:
+    async def _test_ai_connection(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Test AI provider connection"""
-        if not self.current_provider:
+        provider = self.current_provider
+        if not provider:
             return {"error": "No AI provider configured"}
         
         try:
-            connection_ok = await self.current_provider.test_connection()
-            model_info = await self.current_provider.get_model_info()
+            connection_ok = await provider.test_connection()
+            model_info = await provider.get_model_info()
             
             return {
                 "connection_status": "connected" if connection_ok else "failed",
-                "provider": self.current_provider.provider_name,
+                "provider": provider.provider_name,
                 "model_info": model_info
             }
         except Exception as e:
@@ -561,7 +799,7 @@ class JobApplicationAgentServer:
     async def _get_profile(self, args: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": True, "message": "Get profile not yet implemented"}
     
-    async def _list_profiles(self) -> Dict[str, Any]:
+    async def _list_profiles(self, args: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": True, "profiles": [], "message": "List profiles not yet implemented"}
     
     async def _configure_ai_provider(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -591,21 +829,29 @@ class JobApplicationAgentServer:
 
 async def main():
     """Main entry point for the MCP server"""
+    listener = _start_stderr_logging()
     server_instance = JobApplicationAgentServer()
     
     try:
-        await server_instance.initialize()
+        # Only local setup runs before the handshake; provider connection tests follow in the background
+        await server_instance._quick_init()
         async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            server_instance.start_background_init()
             await server_instance.server.run(
                 read_stream,
                 write_stream,
                 server_instance.server.create_initialization_options()
             )
     except KeyboardInterrupt:
-        print("\n🛑 Server stopped by user")
+        logger.info("🛑 Server stopped by user")
     except Exception as e:
-        print(f"💥 Server error: {str(e)}")
+        logger.error(f"💥 Server error: {str(e)}")
         raise
+    finally:
+        # Provider probes use the shared client, so stop them before closing it
+        await server_instance.stop_background_init()
+        await close_shared_http_client()
+        listener.stop()
 
 
 if __name__ == "__main__":
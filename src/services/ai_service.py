@@ -1,21 +1,114 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime
+from collections import deque
+from typing import Deque, Dict, List, Optional, Any, Tuple, Union, Mapping
+from datetime import date, datetime, timedelta
 
-from models.ai_config import AIResponse, UsageMetrics
-from models.form import FormField
-from models.profile import UserProfile
+import httpx
+
+from ..models.ai_config import AIProviderConfig, AIResponse, UsageMetrics
+from ..models.form import FormField
+from ..models.profile import UserProfile
+
+
+# Costs are tracked as integer picodollars so they accumulate exactly; a price per
+# 1k tokens in dollars times this is the price per token in picodollars
+PICODOLLARS_PER_DOLLAR = 10 ** 12
+_PRICE_PER_1K_TO_PICODOLLARS_PER_TOKEN = PICODOLLARS_PER_DOLLAR // 1000
+
+# Most recent detailed usage records kept per provider; totals come from running aggregates
+USAGE_METRICS_WINDOW = 10_000
+
+
+def _month_key(timestamp: datetime) -> str:
+    """Month key in the same "YYYY-MM" form get_monthly_cost accepts"""
+    return f"{timestamp.year:04d}-{timestamp.month:02d}"
+
+
+def _new_usage_bucket() -> Dict[str, Any]:
+    """Running usage totals for one timeframe, with a per-operation breakdown"""
+    return {
+        "requests": 0,
+        "successful": 0,
+        "cost_units": 0,
+        "tokens": 0,
+        "response_time_ms": 0,
+        "operations": {}
+    }
+
+
+def _add_usage(bucket: Dict[str, Any], metrics: UsageMetrics, cost_units: int):
+    """Fold one usage record, costing cost_units picodollars, into a bucket's running totals"""
+    bucket["requests"] += 1
+    bucket["successful"] += metrics.success
+    bucket["cost_units"] += cost_units
+    bucket["tokens"] += metrics.total_tokens
+    bucket["response_time_ms"] += metrics.response_time_ms
+    
+    op_stats = bucket["operations"].get(metrics.operation_type)
+    if op_stats is None:
+        op_stats = bucket["operations"][metrics.operation_type] = {
+            "count": 0,
+            "cost_units": 0,
+            "tokens": 0,
+            "response_time_ms": 0
+        }
+    op_stats["count"] += 1
+    op_stats["cost_units"] += cost_units
+    op_stats["tokens"] += metrics.total_tokens
+    op_stats["response_time_ms"] += metrics.response_time_ms
 
 
 class AIService(ABC):
     """Abstract base class for AI providers"""
     
-    def __init__(self, provider_name: str, config: Dict[str, Any]):
+    __slots__ = (
+        "provider_name", "config", "http_client", "_config_is_model",
+        "usage_metrics", "_total_cost_units", "_total_tokens",
+        "_input_price_units", "_output_price_units",
+        "_usage_all", "_usage_by_day", "_usage_by_month",
+        "_current_day_start", "_current_day_end", "_current_buckets",
+        "__weakref__",
+    )
+    
+    def __init__(
+        self,
+        provider_name: str,
+        config: Union[AIProviderConfig, Mapping[str, Any]],
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         self.provider_name = provider_name
         self.config = config
-        self.usage_metrics: List[UsageMetrics] = []
-        self._total_cost = 0.0
+        self.http_client = http_client
+        self._config_is_model = isinstance(config, AIProviderConfig)
+        self.usage_metrics: Deque[UsageMetrics] = deque(
+            maxlen=self._config_value('metrics_window', USAGE_METRICS_WINDOW)
+        )
+        self._total_cost_units = 0
         self._total_tokens = 0
+        
+        # Token prices in integer picodollars, converted once
+        self._input_price_units = round(
+            self._config_value('cost_per_1k_input', 0.0) * _PRICE_PER_1K_TO_PICODOLLARS_PER_TOKEN
+        )
+        self._output_price_units = round(
+            self._config_value('cost_per_1k_output', 0.0) * _PRICE_PER_1K_TO_PICODOLLARS_PER_TOKEN
+        )
+        
+        # Running totals, updated in record_usage so stats never rescan usage_metrics
+        self._usage_all = _new_usage_bucket()
+        self._usage_by_day: Dict[date, Dict[str, Any]] = {}
+        self._usage_by_month: Dict[str, Dict[str, Any]] = {}
+        
+        # Day/month buckets of the most recent record, valid for timestamps in [start, end)
+        self._current_day_start: Optional[datetime] = None
+        self._current_day_end: Optional[datetime] = None
+        self._current_buckets: Tuple[Dict[str, Any], Dict[str, Any]] = ({}, {})
+    
+    def _config_value(self, key: str, default: Any = None) -> Any:
+        """Read a setting from either a validated AIProviderConfig or a plain dict"""
+        if self._config_is_model:
+            return getattr(self.config, key, default)
+        return self.config.get(key, default)
     
     @abstractmethod
     async def analyze_form_fields(
@@ -109,17 +202,18 @@ class AIService(ABC):
     ) -> UsageMetrics:
         """Record usage metrics for an operation"""
         
-        # Calculate costs based on config
-        input_cost = input_tokens * self.config.get('cost_per_1k_input', 0.0) / 1000
-        output_cost = output_tokens * self.config.get('cost_per_1k_output', 0.0) / 1000
+        # Calculate costs based on config, in exact integer picodollars
+        input_cost_units = input_tokens * self._input_price_units
+        output_cost_units = output_tokens * self._output_price_units
+        cost_units = input_cost_units + output_cost_units
         
         metrics = UsageMetrics(
             provider=self.provider_name,
             operation_type=operation_type,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
-            input_cost=input_cost,
-            output_cost=output_cost,
+            input_cost=input_cost_units / PICODOLLARS_PER_DOLLAR,
+            output_cost=output_cost_units / PICODOLLARS_PER_DOLLAR,
             response_time_ms=response_time_ms,
             success=success,
             error_message=error_message,
@@ -127,26 +221,49 @@ class AIService(ABC):
         )
         
         self.usage_metrics.append(metrics)
-        self._total_cost += metrics.total_cost
+        self._total_cost_units += cost_units
         self._total_tokens += metrics.total_tokens
         
+        # Records almost always land on the same day as the previous one; two datetime
+        # comparisons then replace building a date and month key per record
+        timestamp = metrics.timestamp
+        day_start = self._current_day_start
+        if day_start is not None and day_start <= timestamp < self._current_day_end:
+            day_bucket, month_bucket = self._current_buckets
+        else:
+            day_bucket, month_bucket = self._usage_buckets_for(timestamp)
+        
+        _add_usage(self._usage_all, metrics, cost_units)
+        _add_usage(day_bucket, metrics, cost_units)
+        _add_usage(month_bucket, metrics, cost_units)
+        
         return metrics
     
+    def _usage_buckets_for(self, timestamp: datetime) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Get (creating if needed) the day and month buckets for a timestamp and remember its day"""
+        day, month = timestamp.date(), _month_key(timestamp)
+        day_bucket = self._usage_by_day.get(day)
+        if day_bucket is None:
+            day_bucket = self._usage_by_day[day] = _new_usage_bucket()
+        month_bucket = self._usage_by_month.get(month)
+        if month_bucket is None:
+            month_bucket = self._usage_by_month[month] = _new_usage_bucket()
+        
+        self._current_day_start = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+        self._current_day_end = self._current_day_start + timedelta(days=1)
+        self._current_buckets = (day_bucket, month_bucket)
+        return self._current_buckets
+    
     def get_usage_stats(self, timeframe: str = "all") -> Dict[str, Any]:
         """Get usage statistics"""
-        if timeframe == "all":
-            metrics = self.usage_metrics
-        elif timeframe == "today":
-            today = datetime.now().date()
-            metrics = [m for m in self.usage_metrics if m.timestamp.date() == today]
+        if timeframe == "today":
+            usage = self._usage_by_day.get(datetime.now().date())
         elif timeframe == "month":
-            this_month = datetime.now().strftime("%Y-%m")
-            metrics = [m for m in self.usage_metrics 
-                      if m.timestamp.strftime("%Y-%m") == this_month]
+            usage = self._usage_by_month.get(_month_key(datetime.now()))
         else:
-            metrics = self.usage_metrics
+            usage = self._usage_all
         
-        if not metrics:
+        if not usage or not usage["requests"]:
             return {
                 "total_requests": 0,
                 "total_cost": 0.0,
@@ -155,34 +272,21 @@ class AIService(ABC):
                 "average_response_time": 0
             }
         
-        total_requests = len(metrics)
-        successful_requests = sum(1 for m in metrics if m.success)
-        total_cost = sum(m.total_cost for m in metrics)
-        total_tokens = sum(m.total_tokens for m in metrics)
-        avg_response_time = sum(m.response_time_ms for m in metrics) / len(metrics)
+        total_requests = usage["requests"]
+        successful_requests = usage["successful"]
+        total_cost = usage["cost_units"] / PICODOLLARS_PER_DOLLAR
+        avg_response_time = usage["response_time_ms"] / total_requests
         
         # Operation breakdown
-        operations = {}
-        for metric in metrics:
-            op = metric.operation_type
-            if op not in operations:
-                operations[op] = {
-                    "count": 0,
-                    "cost": 0.0,
-                    "tokens": 0,
-                    "avg_time": 0
-                }
-            operations[op]["count"] += 1
-            operations[op]["cost"] += metric.total_cost
-            operations[op]["tokens"] += metric.total_tokens
-        
-        # Calculate averages for operations
-        for op_stats in operations.values():
-            if op_stats["count"] > 0:
-                op_stats["avg_time"] = sum(
-                    m.response_time_ms for m in metrics 
-                    if m.operation_type in operations.keys()
-                ) / op_stats["count"]
+        operations = {
+            op: {
+                "count": op_stats["count"],
+                "cost": op_stats["cost_units"] / PICODOLLARS_PER_DOLLAR,
+                "tokens": op_stats["tokens"],
+                "avg_time": op_stats["response_time_ms"] / op_stats["count"]
+            }
+            for op, op_stats in usage["operations"].items()
+        }
         
         return {
             "provider": self.provider_name,
@@ -191,10 +295,10 @@ class AIService(ABC):
             "successful_requests": successful_requests,
             "success_rate": (successful_requests / total_requests) * 100,
             "total_cost": round(total_cost, 4),
-            "total_tokens": total_tokens,
+            "total_tokens": usage["tokens"],
             "average_response_time_ms": round(avg_response_time, 2),
             "operations": operations,
-            "cost_per_request": round(total_cost / total_requests, 4) if total_requests > 0 else 0.0
+            "cost_per_request": round(total_cost / total_requests, 4)
         }
     
     def estimate_cost(
@@ -203,21 +307,17 @@ class AIService(ABC):
         estimated_output_tokens: int
     ) -> float:
         """Estimate cost for a request"""
-        input_cost = estimated_input_tokens * self.config.get('cost_per_1k_input', 0.0) / 1000
-        output_cost = estimated_output_tokens * self.config.get('cost_per_1k_output', 0.0) / 1000
+        input_cost = estimated_input_tokens * self._config_value('cost_per_1k_input', 0.0) / 1000
+        output_cost = estimated_output_tokens * self._config_value('cost_per_1k_output', 0.0) / 1000
         return input_cost + output_cost
     
     def get_monthly_cost(self, month: Optional[str] = None) -> float:
         """Get total cost for a specific month"""
         if month is None:
-            month = datetime.now().strftime("%Y-%m")
-        
-        monthly_metrics = [
-            m for m in self.usage_metrics 
-            if m.timestamp.strftime("%Y-%m") == month
-        ]
+            month = _month_key(datetime.now())
         
-        return sum(m.total_cost for m in monthly_metrics)
+        usage = self._usage_by_month.get(month)
+        return usage["cost_units"] / PICODOLLARS_PER_DOLLAR if usage else 0.0
     
     def is_within_budget(self, monthly_budget: float) -> Tuple[bool, float, float]:
         """Check if current usage is within monthly budget"""
@@ -1,18 +1,84 @@
+import asyncio
+import re
 import time
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, Optional, Any, Tuple, Union, Mapping
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
 from fuzzywuzzy import fuzz
 
+try:
+    from rapidfuzz import fuzz as rapid_fuzz, process as rapid_process
+except ImportError:
+    rapid_fuzz = rapid_process = None
+
 from .ai_service import AIService
-from models.ai_config import AIResponse
-from models.form import FormField
-from models.profile import UserProfile
+from ..models.ai_config import AIProviderConfig, AIResponse
+from ..models.form import FieldType, FormField
+from ..models.profile import UserProfile
+
+# Fuzzy scores must be strictly above this to count as a match
+_MIN_MATCH_SCORE = 70
+
+# Distinct lowercased labels whose best pattern match is remembered per service
+LABEL_MATCH_CACHE_SIZE = 4096
+
+# Forms with at least this many fields are matched in a worker thread, off the event loop
+OFFLOAD_MATCHING_MIN_FIELDS = 64
+
+# Fields recognised by keyword in raw HTML, in the order they are reported
+_HTML_FIELDS = (
+    {"field_id": "first_name", "label": "First Name", "field_type": "text", "required": True},
+    {"field_id": "last_name", "label": "Last Name", "field_type": "text", "required": True},
+    {"field_id": "email", "label": "Email", "field_type": "email", "required": True},
+    {"field_id": "phone", "label": "Phone", "field_type": "tel", "required": False},
+)
+
+# AIResponse arguments shared by every response; basic matching never uses tokens or costs money
+_SUCCESS_KW = {"success": True, "tokens_used": 0, "estimated_cost": 0.0}
+_FAILURE_KW = {"success": False, "tokens_used": 0, "estimated_cost": 0.0}
+
+# Canned textarea answers, keyed by the keyword group that selects them
+_TEXTAREA_RESPONSES = {
+    "cover": "I am excited to apply for this position and believe my experience makes me a strong candidate.",
+    "why": "I am passionate about this role and believe my skills align well with your requirements.",
+}
+
+# Anchored lookaheads so "cover letter" anywhere in the label wins over "why", in one match
+_TEXTAREA_KEYWORDS = re.compile(
+    r"(?=.*?(?P<cover>cover letter))|(?=.*?(?P<why>why))", re.IGNORECASE | re.DOTALL
+)
+
+# Only form controls and their labels are built into the parse tree
+_FORM_CONTROL_TAGS = ("input", "select", "textarea")
+_FORM_STRAINER = SoupStrainer(list(_FORM_CONTROL_TAGS) + ["label"])
+
+# Input types that are not fillable fields
+_NON_FIELD_INPUT_TYPES = frozenset(("hidden", "submit", "button", "reset", "image"))
+
+# Input types FieldType knows; any other (e.g. "search", "datetime-local") is reported as text
+_KNOWN_FIELD_TYPES = frozenset(field_type.value for field_type in FieldType)
+
+# Input types whose same-named inputs are the options of one field
+_GROUPED_INPUT_TYPES = frozenset(("radio", "checkbox"))
+
+# Keyword fallback for HTML without form controls; the group name is the field_id found
+_HTML_FIELD_SCANNER = re.compile(
+    r"(?P<first_name>first ?name)|(?P<last_name>last ?name)|(?P<email>email)|(?P<phone>phone)"
+)
 
 
 class BasicMatchingService(AIService):
     """Basic text matching service using fuzzy matching and patterns"""
     
-    def __init__(self, config: Dict[str, Any]):
-        super().__init__("basic_matching", config)
+    __slots__ = (
+        "field_patterns", "_patterns_lc", "_choices", "_choice_paths",
+        "_pattern_paths", "_getters", "_best_pattern",
+    )
+    
+    def __init__(self, config: Union[AIProviderConfig, Mapping[str, Any]], http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__("basic_matching", config, http_client)
         
         # Predefined field patterns for matching
         self.field_patterns = {
@@ -65,6 +131,30 @@ class BasicMatchingService(AIService):
                 "desired salary", "expected salary", "salary expectation"
             ]
         }
+        
+        # Patterns lowercased once, in field_patterns order, for the fuzzy scan
+        self._patterns_lc: List[Tuple[str, Tuple[str, ...]]] = [
+            (profile_path, tuple(pattern.lower() for pattern in patterns))
+            for profile_path, patterns in self.field_patterns.items()
+        ]
+        
+        # Flat, parallel pattern/path lists for RapidFuzz batch scoring
+        self._choices: List[str] = [p for _, patterns in self._patterns_lc for p in patterns]
+        self._choice_paths: List[str] = [path for path, patterns in self._patterns_lc for _ in patterns]
+        
+        # Every pattern mapped to its profile path (first path wins, as in the fuzzy scan)
+        self._pattern_paths: Dict[str, str] = {}
+        for profile_path, patterns in self._patterns_lc:
+            for pattern in patterns:
+                self._pattern_paths.setdefault(pattern, profile_path)
+        
+        # Compiled dotted-path getters for reading profile values
+        self._getters: Dict[str, attrgetter] = {
+            profile_path: attrgetter(profile_path) for profile_path in self.field_patterns
+        }
+        
+        # Labels like "First Name" recur across forms; a label's best pattern never changes
+        self._best_pattern = lru_cache(maxsize=LABEL_MATCH_CACHE_SIZE)(self._score_label)
     
     async def analyze_form_fields(
         self, 
@@ -72,30 +162,26 @@ class BasicMatchingService(AIService):
         context: Optional[Dict[str, Any]] = None
     ) -> AIResponse:
         """Basic form analysis using pattern matching"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Simple HTML parsing to find form fields
             fields = self._extract_fields_from_html(html_content)
             
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             return AIResponse(
-                success=True,
                 data=fields,
                 processing_time_ms=processing_time,
-                tokens_used=0,
-                estimated_cost=0.0
+                **_SUCCESS_KW
             )
             
         except Exception as e:
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
             return AIResponse(
-                success=False,
                 error_message=str(e),
                 processing_time_ms=processing_time,
-                tokens_used=0,
-                estimated_cost=0.0
+                **_FAILURE_KW
             )
     
     async def match_fields_to_profile(
@@ -105,34 +191,29 @@ class BasicMatchingService(AIService):
         context: Optional[Dict[str, Any]] = None
     ) -> AIResponse:
         """Match form fields to profile using pattern matching"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            mappings = []
+            if len(form_fields) >= OFFLOAD_MATCHING_MIN_FIELDS:
+                loop = asyncio.get_running_loop()
+                mappings = await loop.run_in_executor(None, self._match_fields, form_fields, profile)
+            else:
+                mappings = self._match_fields(form_fields, profile)
             
-            for field in form_fields:
-                mapping = self._match_single_field(field, profile)
-                if mapping:
-                    mappings.append(mapping)
-            
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             return AIResponse(
-                success=True,
                 data=mappings,
                 processing_time_ms=processing_time,
-                tokens_used=0,
-                estimated_cost=0.0
+                **_SUCCESS_KW
             )
             
         except Exception as e:
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
             return AIResponse(
-                success=False,
                 error_message=str(e),
                 processing_time_ms=processing_time,
-                tokens_used=0,
-                estimated_cost=0.0
+                **_FAILURE_KW
             )
     
     async def generate_field_response(
@@ -142,29 +223,25 @@ class BasicMatchingService(AIService):
         job_context: Optional[Dict[str, Any]] = None
     ) -> AIResponse:
         """Generate basic responses for fields"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             response = self._generate_basic_response(field_info, profile_data)
             
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             return AIResponse(
-                success=True,
                 data={"response": response},
                 processing_time_ms=processing_time,
-                tokens_used=0,
-                estimated_cost=0.0
+                **_SUCCESS_KW
             )
             
         except Exception as e:
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
             return AIResponse(
-                success=False,
                 error_message=str(e),
                 processing_time_ms=processing_time,
-                tokens_used=0,
-                estimated_cost=0.0
+                **_FAILURE_KW
             )
     
     async def improve_from_feedback(
@@ -174,16 +251,11 @@ class BasicMatchingService(AIService):
         context: Dict[str, Any]
     ) -> AIResponse:
         """Basic feedback learning (placeholder)"""
-        start_time = time.time()
-        
-        processing_time = int((time.time() - start_time) * 1000)
-        
+        # Nothing is processed, so there is no elapsed time to measure
         return AIResponse(
-            success=True,
             data={"message": "Feedback recorded for future improvement"},
-            processing_time_ms=processing_time,
-            tokens_used=0,
-            estimated_cost=0.0
+            processing_time_ms=0,
+            **_SUCCESS_KW
         )
     
     async def test_connection(self) -> bool:
@@ -214,58 +286,82 @@ class BasicMatchingService(AIService):
     
     def _extract_fields_from_html(self, html_content: str) -> List[Dict[str, Any]]:
         """Extract form fields from HTML content"""
-        # Simple field extraction - in a real implementation, this would use BeautifulSoup
-        fields = []
+        # One parse that keeps only labels and form controls
+        soup = BeautifulSoup(html_content, "html.parser", parse_only=_FORM_STRAINER)
         
-        # Look for common form field patterns
-        if "first name" in html_content.lower() or "firstname" in html_content.lower():
-            fields.append({
-                "field_id": "first_name",
-                "label": "First Name",
-                "field_type": "text",
-                "required": True
-            })
+        label_for = {}
+        for label in soup.find_all("label"):
+            target = label.get("for")
+            if target and target not in label_for:
+                label_for[target] = label.get_text(" ", strip=True)
         
-        if "last name" in html_content.lower() or "lastname" in html_content.lower():
-            fields.append({
-                "field_id": "last_name",
-                "label": "Last Name",
-                "field_type": "text",
-                "required": True
-            })
+        fields = []
+        groups = {}
+        for counter, element in enumerate(soup.find_all(_FORM_CONTROL_TAGS)):
+            if element.name == "input":
+                field_type = (element.get("type") or "text").lower()
+                if field_type in _NON_FIELD_INPUT_TYPES:
+                    continue
+                if field_type not in _KNOWN_FIELD_TYPES:
+                    field_type = "text"
+            else:
+                field_type = element.name
+            
+            required = element.has_attr("required") or element.get("aria-required") == "true"
+            
+            # Radio buttons and checkboxes sharing a name are one field with several options
+            group_name = element.get("name") if field_type in _GROUPED_INPUT_TYPES else None
+            if group_name:
+                option = label_for.get(element.get("id")) or element.get("value") or group_name
+                group_key = (field_type, group_name)
+                if group_key in groups:
+                    field, group_label = groups[group_key]
+                    # Per-input labels name the options, so the field falls back to the group's own label
+                    field["label"] = group_label
+                    field["options"].append(option)
+                    field["required"] = field["required"] or required
+                    continue
+            
+            field_id = group_name or element.get("id") or element.get("name") or f"field_{counter}"
+            label = (
+                label_for.get(element.get("id"))
+                or element.get("aria-label")
+                or element.get("placeholder")
+                or element.get("name")
+                or field_id
+            )
+            
+            field = {
+                "field_id": field_id,
+                "label": label,
+                "field_type": field_type,
+                "required": required
+            }
+            if group_name:
+                field["options"] = [option]
+                groups[group_key] = (field, element.get("aria-label") or group_name)
+            fields.append(field)
         
-        if "email" in html_content.lower():
-            fields.append({
-                "field_id": "email",
-                "label": "Email",
-                "field_type": "email",
-                "required": True
-            })
+        if fields:
+            return fields
         
-        if "phone" in html_content.lower():
-            fields.append({
-                "field_id": "phone",
-                "label": "Phone",
-                "field_type": "tel",
-                "required": False
-            })
+        # No form controls (e.g. pasted form text): look for common field keywords in one scan
+        found = set()
+        for match in _HTML_FIELD_SCANNER.finditer(html_content.lower()):
+            found.add(match.lastgroup)
+            if len(found) == len(_HTML_FIELDS):
+                break
         
-        return fields
+        return [dict(spec) for spec in _HTML_FIELDS if spec["field_id"] in found]
+    
+    def _match_fields(self, form_fields: List[FormField], profile: UserProfile) -> List[Dict[str, Any]]:
+        """Match every field to profile data, keeping only the fields that matched"""
+        match = self._match_single_field
+        return [mapping for mapping in (match(field, profile) for field in form_fields) if mapping]
     
     def _match_single_field(self, field: FormField, profile: UserProfile) -> Optional[Dict[str, Any]]:
         """Match a single field to profile data"""
-        label_lower = field.label.lower()
-        
-        # Find best matching pattern
-        best_match = None
-        best_score = 0
-        
-        for profile_path, patterns in self.field_patterns.items():
-            for pattern in patterns:
-                score = fuzz.ratio(label_lower, pattern.lower())
-                if score > best_score and score > 70:  # Minimum threshold
-                    best_score = score
-                    best_match = profile_path
+        best_match, best_score, mapping_source = self._best_pattern(field.label.lower())
         
         if best_match:
             # Extract value from profile
@@ -276,34 +372,58 @@ class BasicMatchingService(AIService):
                 "profile_mapping": best_match,
                 "confidence_score": best_score,
                 "response_value": value,
-                "mapping_source": "pattern_match"
+                "mapping_source": mapping_source
             }
         
         return None
     
+    def _score_label(self, label_lower: str) -> Tuple[Optional[str], int, str]:
+        """Find the profile path whose pattern best matches a lowercased label, with its score and source"""
+        # A label that is exactly a known pattern needs no fuzzy scoring
+        exact_match = self._pattern_paths.get(label_lower)
+        if exact_match is not None:
+            return exact_match, 100, "exact_match"
+        
+        # Find best matching pattern; starting at the threshold makes one compare enough
+        best_match = None
+        best_score = _MIN_MATCH_SCORE
+        
+        # Fuzzy-score every pattern, in one native call when RapidFuzz is installed
+        if rapid_process is not None:
+            hit = rapid_process.extractOne(
+                label_lower, self._choices, scorer=rapid_fuzz.ratio, score_cutoff=best_score
+            )
+            if hit is not None and round(hit[1]) > best_score:
+                best_score = round(hit[1])
+                best_match = self._choice_paths[hit[2]]
+        else:
+            ratio = fuzz.ratio
+            for profile_path, patterns in self._patterns_lc:
+                for pattern in patterns:
+                    score = ratio(label_lower, pattern)
+                    if score > best_score:
+                        best_score = score
+                        best_match = profile_path
+        
+        return best_match, best_score, "pattern_match"
+    
     def _extract_profile_value(self, profile: UserProfile, profile_path: str) -> Any:
         """Extract value from profile using dot notation path"""
+        getter = self._getters.get(profile_path)
+        if getter is None:
+            getter = self._getters[profile_path] = attrgetter(profile_path)
+        
         try:
-            parts = profile_path.split('.')
-            current = profile
-            
-            for part in parts:
-                if hasattr(current, part):
-                    current = getattr(current, part)
-                else:
-                    return None
-            
-            return current
+            return getter(profile)
         except Exception:
             return None
     
     def _generate_basic_response(self, field_info: FormField, profile_data: Any) -> str:
         """Generate basic responses for fields"""
         if field_info.field_type.value == 'textarea':
-            if 'cover letter' in field_info.label.lower():
-                return "I am excited to apply for this position and believe my experience makes me a strong candidate."
-            elif 'why' in field_info.label.lower():
-                return "I am passionate about this role and believe my skills align well with your requirements."
+            keyword = _TEXTAREA_KEYWORDS.match(field_info.label)
+            if keyword:
+                return _TEXTAREA_RESPONSES[keyword.lastgroup]
         
         # Return profile data if available
         if profile_data:
@@ -1,47 +1,123 @@
+import hashlib
 import json
 import time
 import asyncio
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Union, Mapping
 import httpx
 import tiktoken
 from openai import AsyncOpenAI
 
 from .ai_service import AIService
-from models.ai_config import AIResponse
-from models.form import FormField
-from models.profile import UserProfile
-from utils.prompts import PromptManager
+from ..models.ai_config import AIProviderConfig, AIResponse, RateLimit
+from ..models.form import FormField
+from ..models.profile import UserProfile
+from ..utils.prompts import PromptManager
+
+try:
+    import h2  # noqa: F401 - lets httpx negotiate HTTP/2
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Connection pool ceiling, well above the fan-out of concurrent field requests
+HTTP_MAX_CONNECTIONS = 1000
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 200
+
+# In-flight API requests allowed per service unless the config sets max_concurrency
+DEFAULT_MAX_CONCURRENCY = 32
+
+# Completions kept per service for identical repeat requests (same fields, same form HTML)
+RESPONSE_CACHE_SIZE = 256
+
+# Error reported by _extract_json_from_text when a reply holds no parseable JSON
+_JSON_PARSE_ERROR = "Failed to parse AI response"
+
+# One keep-alive connection pool shared by every DeepSeekService in the process,
+# so repeated service construction doesn't pay a fresh TCP + TLS handshake
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Get (creating on first use) the process-wide HTTP client for DeepSeek requests"""
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=300.0
+            ),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            http2=_HTTP2_AVAILABLE
+        )
+    return _shared_http_client
+
+
+async def close_shared_http_client():
+    """Close the process-wide HTTP client and drop its pooled connections"""
+    global _shared_http_client
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
+
+
+@lru_cache(maxsize=8)
+def _get_encoder(model_name: str) -> tiktoken.Encoding:
+    """Get the tiktoken encoder for a model, loading each BPE table once per process"""
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=256)
+def _cached_token_count(encoder: tiktoken.Encoding, text: str) -> int:
+    """Token count for a text that recurs across requests, such as a system prompt"""
+    return len(encoder.encode(text))
 
 
 class DeepSeekService(AIService):
     """DeepSeek AI provider implementation"""
     
-    def __init__(self, config: Dict[str, Any]):
-        super().__init__("deepseek", config)
+    def __init__(self, config: Union[AIProviderConfig, Mapping[str, Any]], http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__("deepseek", config, http_client or get_shared_http_client())
         
-        # Initialize OpenAI client for DeepSeek API
+        # Initialize OpenAI client for DeepSeek API on the shared connection pool
         self.client = AsyncOpenAI(
-            api_key=config.get('api_key'),
-            base_url=config.get('api_base', 'https://api.deepseek.com/v1')
+            api_key=self._config_value('api_key'),
+            base_url=self._config_value('api_base', 'https://api.deepseek.com/v1'),
+            http_client=self.http_client
         )
         
-        self.model = config.get('model', 'deepseek-chat')
-        self.max_tokens = config.get('max_tokens', 4000)
-        self.temperature = config.get('temperature', 0.1)
-        self.timeout = config.get('timeout_seconds', 30)
+        self.model = self._config_value('model', 'deepseek-chat')
+        self.max_tokens = self._config_value('max_tokens', 4000)
+        self.temperature = self._config_value('temperature', 0.1)
+        self.timeout = self._config_value('timeout_seconds', 30)
         
-        # Initialize tokenizer for accurate token counting
-        try:
-            self.tokenizer = tiktoken.encoding_for_model("gpt-3.5-turbo")  # Use GPT tokenizer as approximation
-        except KeyError:
-            self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        # Initialize tokenizer for accurate token counting, shared by every instance
+        self.tokenizer = _get_encoder("gpt-3.5-turbo")  # Use GPT tokenizer as approximation
         
         # Load prompts
         self.prompt_manager = PromptManager()
         
         # Rate limiting
-        self.rate_limit = config.get('rate_limit', {})
-        self.request_timestamps = []
+        rate_limit = self._config_value('rate_limit', {})
+        self.rate_limit = rate_limit.model_dump() if isinstance(rate_limit, RateLimit) else rate_limit
+        
+        # Token bucket: holds up to requests_per_minute tokens, refilled at requests_per_minute / 60 per second
+        self._bucket_capacity = float(self.rate_limit.get('requests_per_minute', 100))
+        self._tokens = self._bucket_capacity
+        self._tokens_updated = time.monotonic()
+        self._max_concurrency = self._config_value('max_concurrency', DEFAULT_MAX_CONCURRENCY)
+        
+        # Created on first use, inside the running loop
+        self._rate_limit_lock: Optional[asyncio.Lock] = None
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        
+        # Request digest -> completion, least recently used first
+        self._response_cache: "OrderedDict[str, Any]" = OrderedDict()
         
     async def analyze_form_fields(
         self, 
@@ -53,9 +129,6 @@ class DeepSeekService(AIService):
         operation_type = "form_analysis"
         
         try:
-            # Check rate limits
-            await self._check_rate_limits()
-            
             # Prepare the prompt
             system_prompt = self.prompt_manager.get_form_analysis_prompt()
             
@@ -65,10 +138,10 @@ class DeepSeekService(AIService):
                 user_message += f"\n\nAdditional Context:\n{json.dumps(context, indent=2)}"
             
             # Count tokens
-            input_tokens = self._count_tokens_accurate(system_prompt + user_message)
+            input_tokens = self._count_prompt_tokens(system_prompt, user_message)
             
             # Make API call
-            response = await self.client.chat.completions.create(
+            response, cache_key = await self._create_completion(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -82,12 +155,16 @@ class DeepSeekService(AIService):
             # Parse response
             result_text = response.choices[0].message.content
             output_tokens = response.usage.completion_tokens if response.usage else self._count_tokens_accurate(result_text)
+            if cache_key is None:
+                # Served from the response cache; nothing was sent or billed
+                input_tokens = output_tokens = 0
             
             try:
                 result_data = json.loads(result_text)
             except json.JSONDecodeError:
                 # Fallback: try to extract JSON from response
                 result_data = self._extract_json_from_text(result_text)
+            self._cache_completion(cache_key, response, result_data)
             
             processing_time = int((time.time() - start_time) * 1000)
             
@@ -143,8 +220,6 @@ class DeepSeekService(AIService):
         operation_type = "field_matching"
         
         try:
-            await self._check_rate_limits()
-            
             # Prepare field information
             fields_info = []
             for field in form_fields:
@@ -175,9 +250,9 @@ User Profile Summary:
             if context:
                 user_message += f"\n\nJob/Company Context:\n{json.dumps(context, indent=2)}"
             
-            input_tokens = self._count_tokens_accurate(system_prompt + user_message)
+            input_tokens = self._count_prompt_tokens(system_prompt, user_message)
             
-            response = await self.client.chat.completions.create(
+            response, cache_key = await self._create_completion(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -190,11 +265,15 @@ User Profile Summary:
             
             result_text = response.choices[0].message.content
             output_tokens = response.usage.completion_tokens if response.usage else self._count_tokens_accurate(result_text)
+            if cache_key is None:
+                # Served from the response cache; nothing was sent or billed
+                input_tokens = output_tokens = 0
             
             try:
                 result_data = json.loads(result_text)
             except json.JSONDecodeError:
                 result_data = self._extract_json_from_text(result_text)
+            self._cache_completion(cache_key, response, result_data)
             
             processing_time = int((time.time() - start_time) * 1000)
             
@@ -249,8 +328,6 @@ User Profile Summary:
         operation_type = "response_generation"
         
         try:
-            await self._check_rate_limits()
-            
             system_prompt = self.prompt_manager.get_response_generation_prompt()
             
             field_details = {
@@ -273,9 +350,9 @@ Profile Data:
             if job_context:
                 user_message += f"\n\nJob Context:\n{json.dumps(job_context, indent=2)}"
             
-            input_tokens = self._count_tokens_accurate(system_prompt + user_message)
+            input_tokens = self._count_prompt_tokens(system_prompt, user_message)
             
-            response = await self.client.chat.completions.create(
+            response, cache_key = await self._create_completion(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -288,11 +365,15 @@ Profile Data:
             
             result_text = response.choices[0].message.content
             output_tokens = response.usage.completion_tokens if response.usage else self._count_tokens_accurate(result_text)
+            if cache_key is None:
+                # Served from the response cache; nothing was sent or billed
+                input_tokens = output_tokens = 0
             
             try:
                 result_data = json.loads(result_text)
             except json.JSONDecodeError:
                 result_data = self._extract_json_from_text(result_text)
+            self._cache_completion(cache_key, response, result_data)
             
             processing_time = int((time.time() - start_time) * 1000)
             
@@ -398,8 +479,8 @@ Profile Data:
             "max_tokens": self.max_tokens,
             "temperature": self.temperature,
             "context_length": self.max_context_length,
-            "cost_per_1k_input": self.config.get('cost_per_1k_input', 0.0),
-            "cost_per_1k_output": self.config.get('cost_per_1k_output', 0.0),
+            "cost_per_1k_input": self._config_value('cost_per_1k_input', 0.0),
+            "cost_per_1k_output": self._config_value('cost_per_1k_output', 0.0),
             "supports_json_mode": True,
             "supports_function_calling": False
         }
@@ -423,25 +504,69 @@ Profile Data:
             # Fallback to basic estimation
             return super()._count_tokens(text)
     
-    async def _check_rate_limits(self):
-        """Check and enforce rate limits"""
-        current_time = time.time()
+    def _count_prompt_tokens(self, system_prompt: str, user_message: str) -> int:
+        """Count input tokens, tokenizing each distinct system prompt only once per process"""
+        try:
+            return _cached_token_count(self.tokenizer, system_prompt) + len(self.tokenizer.encode(user_message))
+        except Exception:
+            # Fallback to basic estimation
+            return super()._count_tokens(system_prompt + user_message)
+    
+    async def _create_completion(self, **kwargs) -> Tuple[Any, Optional[str]]:
+        """
+        Send a chat completion once a rate-limit token and a concurrency slot are free
+        
+        Returns the completion and its response-cache key, or None for the key when the
+        completion was served from the cache. Callers pass the key to _cache_completion
+        once the reply has parsed.
+        """
+        cache_key = hashlib.blake2b(
+            json.dumps(kwargs, sort_keys=True, default=str).encode(), digest_size=16
+        ).hexdigest()
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            self._response_cache.move_to_end(cache_key)
+            return cached, None
         
-        # Clean old timestamps (older than 1 minute)
-        self.request_timestamps = [
-            ts for ts in self.request_timestamps 
-            if current_time - ts < 60
-        ]
+        await self._check_rate_limits()
         
-        # Check requests per minute limit
-        requests_per_minute = self.rate_limit.get('requests_per_minute', 100)
-        if len(self.request_timestamps) >= requests_per_minute:
-            sleep_time = 60 - (current_time - self.request_timestamps[0])
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
+        if self._request_slots is None:
+            self._request_slots = asyncio.Semaphore(self._max_concurrency)
+        async with self._request_slots:
+            return await self.client.chat.completions.create(**kwargs), cache_key
+    
+    def _cache_completion(self, cache_key: Optional[str], response: Any, result_data: Dict[str, Any]):
+        """Keep a completion for identical repeat requests, unless it was truncated or failed to parse"""
+        if cache_key is None or response.choices[0].finish_reason != "stop":
+            return
+        if result_data.get("error") == _JSON_PARSE_ERROR:
+            return
         
-        # Record this request
-        self.request_timestamps.append(current_time)
+        self._response_cache[cache_key] = response
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+    
+    async def _check_rate_limits(self):
+        """Check and enforce rate limits by taking a token from the bucket, waiting for a refill if empty"""
+        if self._rate_limit_lock is None:
+            self._rate_limit_lock = asyncio.Lock()
+        
+        # Waiters queue on the lock, so tokens are handed out in arrival order at the refill rate
+        async with self._rate_limit_lock:
+            refill_rate = self._bucket_capacity / 60
+            self._refill_tokens(refill_rate)
+            
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / refill_rate)
+                self._refill_tokens(refill_rate)
+            
+            self._tokens -= 1
+    
+    def _refill_tokens(self, refill_rate: float):
+        """Add the tokens earned since the last refill, up to the bucket capacity"""
+        now = time.monotonic()
+        self._tokens = min(self._bucket_capacity, self._tokens + (now - self._tokens_updated) * refill_rate)
+        self._tokens_updated = now
     
     def _create_profile_summary(self, profile: UserProfile) -> Dict[str, Any]:
         """Create a summary of user profile for AI processing"""
@@ -507,7 +632,7 @@ Profile Data:
         
         # Return error format if extraction fails
         return {
-            "error": "Failed to parse AI response",
+            "error": _JSON_PARSE_ERROR,
             "raw_response": text[:500]  # First 500 chars for debugging
         }
     
@@ -1,22 +1,24 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union, Mapping
 import time
 import json
 
+import httpx
+
 from .ai_service import AIService
-from models.ai_config import AIResponse
-from models.form import FormField
-from models.profile import UserProfile
+from ..models.ai_config import AIProviderConfig, AIResponse
+from ..models.form import FormField
+from ..models.profile import UserProfile
 
 
 class LocalService(AIService):
     """Local AI provider implementation (placeholder for future local model support)"""
     
-    def __init__(self, config: Dict[str, Any]):
-        super().__init__("local", config)
+    def __init__(self, config: Union[AIProviderConfig, Mapping[str, Any]], http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__("local", config, http_client)
         
-        self.model_path = config.get('model_path', './models/local_model')
-        self.max_tokens = config.get('max_tokens', 2048)
-        self.temperature = config.get('temperature', 0.1)
+        self.model_path = self._config_value('model_path', './models/local_model')
+        self.max_tokens = self._config_value('max_tokens', 2048)
+        self.temperature = self._config_value('temperature', 0.1)
         
         # Note: Actual model loading would happen here
         self.model = None
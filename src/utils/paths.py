@@ -16,6 +16,15 @@ class PathManager:
         self.data_dir = self.base_dir / "data"
         self.config_dir = self.base_dir / "config"
         self.logs_dir = self.base_dir / "logs"
+        
+        # Derived directories are resolved once rather than on every getter call
+        self.profiles_dir = self.data_dir / "profiles"
+        self.applications_dir = self.data_dir / "applications"
+        self.field_mappings_dir = self.data_dir / "field_mappings"
+        self.sample_forms_dir = self.data_dir / "sample_forms"
+        self.prompts_dir = self.config_dir / "prompts"
+        
+        self._dirs_ready = False
     
     def get_base_dir(self) -> Path:
         """Get base application directory"""
@@ -35,39 +44,44 @@ class PathManager:
     
     def get_profiles_dir(self) -> Path:
         """Get profiles storage directory"""
-        return self.data_dir / "profiles"
+        return self.profiles_dir
     
     def get_applications_dir(self) -> Path:
         """Get applications storage directory"""
-        return self.data_dir / "applications"
+        return self.applications_dir
     
     def get_field_mappings_dir(self) -> Path:
         """Get field mappings storage directory"""
-        return self.data_dir / "field_mappings"
+        return self.field_mappings_dir
     
     def get_sample_forms_dir(self) -> Path:
         """Get sample forms directory"""
-        return self.data_dir / "sample_forms"
+        return self.sample_forms_dir
     
     def get_prompts_dir(self) -> Path:
         """Get AI prompts directory"""
-        return self.config_dir / "prompts"
+        return self.prompts_dir
     
     def ensure_directories_exist(self):
-        """Create all necessary directories"""
+        """Create all necessary directories (only the first call touches the filesystem)"""
+        if self._dirs_ready:
+            return
+        
         directories = [
             self.data_dir,
             self.config_dir,
             self.logs_dir,
-            self.get_profiles_dir(),
-            self.get_applications_dir(),
-            self.get_field_mappings_dir(),
-            self.get_sample_forms_dir(),
-            self.get_prompts_dir()
+            self.profiles_dir,
+            self.applications_dir,
+            self.field_mappings_dir,
+            self.sample_forms_dir,
+            self.prompts_dir
         ]
         
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
+        
+        self._dirs_ready = True
     
     def get_temp_dir(self) -> Path:
         """Get temporary directory for file processing"""
@@ -1,10 +1,32 @@
+import asyncio
 import json
 import os
+import tempfile
 import aiofiles
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=str, option=option)
+    return json.dumps(data, indent=2 if indent else None, default=str, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(content: Union[str, bytes]) -> Any:
+    """Parse JSON text, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 class StorageManager:
     """Manages local JSON file storage for profiles, applications, and other data"""
@@ -15,6 +37,11 @@ class StorageManager:
         self.applications_dir = self.data_dir / "applications" 
         self.field_mappings_dir = self.data_dir / "field_mappings"
         self.forms_dir = self.data_dir / "forms"
+        # One [file_id, {profile_id, name, email, created_at, updated_at}] JSON line per
+        # profile, newest first; kept beside (not inside) profiles_dir so profile globs never see it
+        self.profiles_index_file = self.data_dir / "profiles_index.jsonl"
+        # Serializes profile writes with the index updates that follow them; created on first use
+        self._profiles_index_lock: Optional[asyncio.Lock] = None
     
     async def initialize(self):
         """Initialize storage directories"""
@@ -29,6 +56,27 @@ class StorageManager:
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
     
+    async def _write_json(self, file_path: Path, data: Dict[str, Any]):
+        """Atomically write JSON data"""
+        await self._write_atomic(file_path, _json_dumps(data))
+    
+    async def _write_atomic(self, file_path: Path, payload: bytes):
+        """Write a sibling temp file, then rename it over the target"""
+        # A unique temp name per write, so concurrent writers to one target never share it
+        with tempfile.NamedTemporaryFile(
+            dir=file_path.parent, prefix=f".{file_path.name}.", suffix='.tmp', delete=False
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+        
+        try:
+            async with aiofiles.open(tmp_path, 'wb') as f:
+                await f.write(payload)
+            
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
     # Profile Storage
     async def save_profile(self, profile_id: str, profile_data: Dict[str, Any]) -> bool:
         """Save user profile to JSON file"""
@@ -36,8 +84,11 @@ class StorageManager:
             file_path = self.profiles_dir / f"{profile_id}.json"
             profile_data["updated_at"] = datetime.now().isoformat()
             
-            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(profile_data, indent=2, default=str, ensure_ascii=False))
+            async with self._index_lock():
+                index_fresh = self._profiles_index_is_fresh()
+                
+                await self._write_json(file_path, profile_data)
+                await self._update_profiles_index(profile_id, self._profile_index_entry(profile_data), index_fresh)
             
             return True
         except Exception as e:
@@ -53,7 +104,7 @@ class StorageManager:
             
             async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
                 content = await f.read()
-                return json.loads(content)
+                return _json_loads(content)
         except Exception as e:
             print(f"Error loading profile {profile_id}: {str(e)}")
             return None
@@ -67,17 +118,10 @@ class StorageManager:
                 try:
                     async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
                         content = await f.read()
-                        profile_data = json.loads(content)
+                        profile_data = _json_loads(content)
                         
                         # Extract basic info for listing
-                        profile_info = {
-                            "profile_id": profile_data.get("profile_id"),
-                            "name": profile_data.get("personal", {}).get("full_name", "Unknown"),
-                            "email": profile_data.get("contact", {}).get("email"),
-                            "created_at": profile_data.get("created_at"),
-                            "updated_at": profile_data.get("updated_at")
-                        }
-                        profiles.append(profile_info)
+                        profiles.append(self._profile_index_entry(profile_data))
                         
                 except Exception as e:
                     print(f"Error reading profile file {file_path}: {str(e)}")
@@ -87,14 +131,106 @@ class StorageManager:
         
         return sorted(profiles, key=lambda x: x.get("updated_at", ""), reverse=True)
     
+    async def iter_profiles_index(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield basic profile info, most recently updated first, streamed from the index file"""
+        try:
+            async with self._index_lock():
+                if not self._profiles_index_is_fresh():
+                    await self._write_profiles_index(await self._scan_profiles_index())
+        except Exception as e:
+            print(f"Error rebuilding profiles index: {str(e)}")
+            for profile_info in await self.list_profiles():
+                yield profile_info
+            return
+        
+        async with aiofiles.open(self.profiles_index_file, 'r', encoding='utf-8') as f:
+            async for line in f:
+                if line.strip():
+                    yield _json_loads(line)[1]
+    
+    async def list_profiles_index(self) -> List[Dict[str, Any]]:
+        """List profiles from the index file, rebuilding it if missing or stale"""
+        return [profile_info async for profile_info in self.iter_profiles_index()]
+    
+    def _index_lock(self) -> asyncio.Lock:
+        """Get the lock held while a profile file and the listing index are updated together"""
+        if self._profiles_index_lock is None:
+            self._profiles_index_lock = asyncio.Lock()
+        return self._profiles_index_lock
+    
+    def _profiles_index_is_fresh(self) -> bool:
+        """Whether the index is newer than the last change to the profiles directory"""
+        try:
+            # Adding, removing or replacing a profile file bumps the directory mtime
+            return self.profiles_dir.stat().st_mtime <= self.profiles_index_file.stat().st_mtime
+        except FileNotFoundError:
+            return False
+    
+    async def _scan_profiles_index(self) -> Dict[str, Dict[str, Any]]:
+        """Read every profile file and build its listing index rows, keyed by file id"""
+        index = {}
+        for file_path in self.profiles_dir.glob("*.json"):
+            try:
+                async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
+                    index[file_path.stem] = self._profile_index_entry(_json_loads(await f.read()))
+            except Exception as e:
+                print(f"Error reading profile file {file_path}: {str(e)}")
+                continue
+        
+        return index
+    
+    async def _write_profiles_index(self, index: Dict[str, Dict[str, Any]]):
+        """Write the listing index as JSON lines, most recently updated first"""
+        rows = sorted(index.items(), key=lambda item: item[1].get("updated_at") or "", reverse=True)
+        payload = b"".join(_json_dumps(list(row), indent=False) + b"\n" for row in rows)
+        await self._write_atomic(self.profiles_index_file, payload)
+    
+    def _profile_index_entry(self, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the basic profile info stored in the listing index"""
+        return {
+            "profile_id": profile_data.get("profile_id"),
+            "name": profile_data.get("personal", {}).get("full_name", "Unknown"),
+            "email": profile_data.get("contact", {}).get("email"),
+            "created_at": profile_data.get("created_at"),
+            "updated_at": profile_data.get("updated_at")
+        }
+    
+    async def _update_profiles_index(self, profile_id: str, entry: Optional[Dict[str, Any]], index_fresh: bool):
+        """Replace (or with entry=None, remove) one profile's row in the listing index
+        
+        index_fresh must be checked before the profile file itself is touched, and both
+        done under _index_lock(). A failure here never fails the profile write itself.
+        """
+        if not index_fresh:
+            # Rebuilt from a full scan on the next iter_profiles_index() call
+            self.profiles_index_file.unlink(missing_ok=True)
+            return
+        
+        try:
+            async with aiofiles.open(self.profiles_index_file, 'r', encoding='utf-8') as f:
+                index = dict(_json_loads(line) for line in (await f.read()).splitlines() if line.strip())
+            
+            if entry is None:
+                index.pop(profile_id, None)
+            else:
+                index[profile_id] = entry
+            
+            await self._write_profiles_index(index)
+        except Exception as e:
+            print(f"Error updating profiles index: {str(e)}")
+            self.profiles_index_file.unlink(missing_ok=True)
+    
     async def delete_profile(self, profile_id: str) -> bool:
         """Delete a profile"""
         try:
             file_path = self.profiles_dir / f"{profile_id}.json"
-            if file_path.exists():
-                file_path.unlink()
-                return True
-            return False
+            async with self._index_lock():
+                if file_path.exists():
+                    index_fresh = self._profiles_index_is_fresh()
+                    file_path.unlink()
+                    await self._update_profiles_index(profile_id, None, index_fresh)
+                    return True
+                return False
         except Exception as e:
             print(f"Error deleting profile {profile_id}: {str(e)}")
             return False
@@ -106,8 +242,7 @@ class StorageManager:
             file_path = self.applications_dir / f"{application_id}.json"
             application_data["updated_at"] = datetime.now().isoformat()
             
-            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(application_data, indent=2, default=str, ensure_ascii=False))
+            await self._write_json(file_path, application_data)
             
             return True
         except Exception as e:
@@ -123,7 +258,7 @@ class StorageManager:
             
             async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
                 content = await f.read()
-                return json.loads(content)
+                return _json_loads(content)
         except Exception as e:
             print(f"Error loading application {application_id}: {str(e)}")
             return None
@@ -137,7 +272,7 @@ class StorageManager:
                 try:
                     async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
                         content = await f.read()
-                        app_data = json.loads(content)
+                        app_data = _json_loads(content)
                         
                         # Filter by profile if specified
                         if profile_id and app_data.get("profile_id") != profile_id:
@@ -179,14 +314,13 @@ class StorageManager:
             # Load existing if present to increment usage count
             if file_path.exists():
                 async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                    existing_data = json.loads(await f.read())
+                    existing_data = _json_loads(await f.read())
                     mappings_data["usage_count"] = existing_data.get("usage_count", 0) + 1
                     mappings_data["created_at"] = existing_data.get("created_at")
             
             mappings_data["updated_at"] = datetime.now().isoformat()
             
-            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(mappings_data, indent=2, default=str, ensure_ascii=False))
+            await self._write_json(file_path, mappings_data)
             
             return True
         except Exception as e:
@@ -202,7 +336,7 @@ class StorageManager:
             
             async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
                 content = await f.read()
-                return json.loads(content)
+                return _json_loads(content)
         except Exception as e:
             print(f"Error loading field mappings for {form_id}: {str(e)}")
             return None
@@ -214,8 +348,7 @@ class StorageManager:
             file_path = self.forms_dir / f"{form_id}.json"
             form_data["updated_at"] = datetime.now().isoformat()
             
-            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(form_data, indent=2, default=str, ensure_ascii=False))
+            await self._write_json(file_path, form_data)
             
             return True
         except Exception as e:
@@ -231,7 +364,7 @@ class StorageManager:
             
             async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
                 content = await f.read()
-                return json.loads(content)
+                return _json_loads(content)
         except Exception as e:
             print(f"Error loading form {form_id}: {str(e)}")
             return None
@@ -246,8 +379,7 @@ class StorageManager:
             file_path = category_dir / f"{item_id}.json"
             data["updated_at"] = datetime.now().isoformat()
             
-            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(data, indent=2, default=str, ensure_ascii=False))
+            await self._write_json(file_path, data)
             
             return True
         except Exception as e:
@@ -263,7 +395,7 @@ class StorageManager:
             
             async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
                 content = await f.read()
-                return json.loads(content)
+                return _json_loads(content)
         except Exception as e:
             print(f"Error loading {category}/{item_id}: {str(e)}")
             return None
@@ -300,28 +432,28 @@ class StorageManager:
             profile_files = list(self.profiles_dir.glob("*.json"))
             for file_path in profile_files:
                 async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                    profile_data = json.loads(await f.read())
+                    profile_data = _json_loads(await f.read())
                     export_data["profiles"].append(profile_data)
             
             # Export applications
             app_files = list(self.applications_dir.glob("*.json"))
             for file_path in app_files:
                 async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                    app_data = json.loads(await f.read())
+                    app_data = _json_loads(await f.read())
                     export_data["applications"].append(app_data)
             
             # Export field mappings
             mapping_files = list(self.field_mappings_dir.glob("*.json"))
             for file_path in mapping_files:
                 async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                    mapping_data = json.loads(await f.read())
+                    mapping_data = _json_loads(await f.read())
                     export_data["field_mappings"].append(mapping_data)
             
             # Export forms
             form_files = list(self.forms_dir.glob("*.json"))
             for file_path in form_files:
                 async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                    form_data = json.loads(await f.read())
+                    form_data = _json_loads(await f.read())
                     export_data["forms"].append(form_data)
             
         except Exception as e:
@@ -7,12 +7,14 @@ import asyncio
 import json
 import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from src.models.profile import UserProfile, PersonalInfo, ContactInfo
+from src.services.basic_matching_service import BasicMatchingService
 from src.services.form_analyzer import FormAnalyzer
 from src.services.semantic_matcher import SemanticMatcher
 from src.services.validator import Validator
@@ -256,6 +258,74 @@ async def test_with_sample_data():
     return True
 
 
+async def test_concurrent_profile_saves():
+    """Test that concurrent profile saves and deletes all land in the profiles index"""
+    print("\n🧪 Testing Concurrent Profile Saves")
+    print("=" * 60)
+    
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = StorageManager(data_dir)
+        await storage.initialize()
+        
+        # Start from a fresh index so saves update it in place
+        await storage.list_profiles_index()
+        
+        saved = await asyncio.gather(*(
+            storage.save_profile(f"p{i}", {"profile_id": f"p{i}"}) for i in range(8)
+        ))
+        assert all(saved), "Concurrent profile save failed"
+        
+        listed = {info["profile_id"] for info in await storage.list_profiles_index()}
+        assert listed == {f"p{i}" for i in range(8)}, f"Profiles missing from index: {listed}"
+        
+        await asyncio.gather(
+            *(storage.delete_profile(f"p{i}") for i in range(0, 8, 2)),
+            *(storage.save_profile(f"q{i}", {"profile_id": f"q{i}"}) for i in range(4))
+        )
+        
+        listed = {info["profile_id"] for info in await storage.list_profiles_index()}
+        expected = {f"p{i}" for i in range(1, 8, 2)} | {f"q{i}" for i in range(4)}
+        assert listed == expected, f"Profiles index out of date: {listed}"
+    
+    print("   ✅ Profiles index consistent after concurrent saves and deletes")
+    return True
+
+
+def test_basic_html_field_extraction():
+    """Test basic matching's HTML field extraction without AI"""
+    print("\n🧪 Testing Basic HTML Field Extraction")
+    print("=" * 60)
+    
+    service = BasicMatchingService({})
+    
+    html_content = """
+    <form>
+        <label for="fname">First Name</label>
+        <input id="fname" name="first_name" type="text" required>
+        <input type="radio" name="gender" id="gender_m" value="m"><label for="gender_m">Male</label>
+        <input type="radio" name="gender" id="gender_f" value="f"><label for="gender_f">Female</label>
+        <input type="search" name="city" placeholder="City">
+        <input type="hidden" name="csrf" value="token">
+        <input type="submit" value="Apply">
+    </form>
+    """
+    fields = {field["field_id"]: field for field in service._extract_fields_from_html(html_content)}
+    
+    assert set(fields) == {"fname", "gender", "city"}, f"Unexpected fields: {sorted(fields)}"
+    assert fields["fname"]["label"] == "First Name", "Label for= not resolved"
+    assert fields["fname"]["required"] is True, "Required attribute not read"
+    assert fields["gender"]["field_type"] == "radio", "Radio group type lost"
+    assert fields["gender"]["options"] == ["Male", "Female"], "Radio group not collapsed into options"
+    assert fields["city"]["field_type"] == "text", "Unknown input type not mapped to text"
+    print("   ✅ Form controls extracted")
+    
+    # Pasted form text without controls falls back to keyword detection
+    fields = service._extract_fields_from_html("Please enter your first name, email and phone")
+    assert [field["field_id"] for field in fields] == ["first_name", "email", "phone"], "Keyword fallback failed"
+    print("   ✅ Keyword fallback working")
+    return True
+
+
 def check_ai_availability():
     """Check if AI service can be initialized"""
     print("\n🤖 Checking AI Service Availability")
@@ -302,8 +372,8 @@ async def main():
                 print("\n🎉 System is ready to use!")
                 print("\nNext steps:")
                 print("   1. Set up DeepSeek API key for AI features")
-                print("   2. Run: python src/cli.py setup")
-                print("   3. Create profile: python src/cli.py create-profile")
+                print("   2. Run: python -m src.cli setup")
+                print("   3. Create profile: python -m src.cli create-profile")
                 print("   4. Test with Claude Desktop integration")
                 return True
             else: